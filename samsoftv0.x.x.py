@@ -35,6 +35,7 @@ import time
 import random
 import struct
 import json
+import threading
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 from enum import IntEnum, auto
@@ -244,13 +245,26 @@ class GBAPPU:
     # Frame buffer (RGB565)
     framebuffer: List[int] = field(default_factory=lambda: [0] * (240 * 160))
     
+    # Region of the framebuffer written since the last paint (a fresh PPU is fully dirty)
+    dirty_rect: QtCore.QRect = field(default_factory=lambda: QtCore.QRect(0, 0, 240, 160))
+    
     def get_mode(self) -> int:
         """Get current PPU mode from DISPCNT"""
         return self.dispcnt & 0x7
         
+    def mark_dirty(self, x: int, y: int, w: int, h: int):
+        """Add a framebuffer region to the pending dirty rect"""
+        self.dirty_rect = self.dirty_rect.united(QtCore.QRect(x, y, w, h))
+        
+    def clear_dirty(self):
+        """Reset the dirty rect once the display has consumed it"""
+        self.dirty_rect = QtCore.QRect()
+        
     def render_scanline(self, memory: GBAMemory):
         """Render current scanline"""
         mode = self.get_mode()
+        if self.vcount < self.HEIGHT:
+            self.mark_dirty(0, self.vcount, self.WIDTH, 1)
         
         if mode == PPUMode.MODE3:
             # Mode 3: Direct 16-bit color bitmap
@@ -337,6 +351,9 @@ class GBACore:
         # Save state support
         self.save_state_version = 1
         
+        # Scratch row used when mapping the CHIP-8 display
+        self._black_row = [0x0000] * 240
+        
         # CHIP-8 compatibility core (hidden implementation)
         self._chip8_core = self._init_chip8_compat()
         
@@ -574,6 +591,11 @@ class GBACore:
             
         self.frame_count += 1
         
+    @property
+    def dirty_rect(self) -> QtCore.QRect:
+        """Framebuffer region changed since the display last painted"""
+        return self.ppu.dirty_rect
+        
     def _map_chip8_to_gba(self):
         """Map CHIP-8 64x32 display to GBA 240x160 framebuffer"""
         # Scale CHIP-8 display to fit GBA screen
@@ -582,25 +604,33 @@ class GBACore:
         offset_x = (240 - 64 * scale_x) // 2
         offset_y = (160 - 32 * scale_y) // 2
         
-        # Clear framebuffer
-        for i in range(len(self.ppu.framebuffer)):
-            self.ppu.framebuffer[i] = 0x0000  # Black
+        fb = self.ppu.framebuffer
+        black = self._black_row
+        left = black[:offset_x]
+        right = black[offset_x + 64 * scale_x:]
+        first_dirty = last_dirty = -1
+        
+        # Build each output scanline (black border, scaled CHIP-8 pixels in
+        # white RGB555) and only write back the rows that actually changed
+        for gy in range(160):
+            cy = (gy - offset_y) // scale_y
+            if gy < offset_y or cy >= 32:
+                line = black
+            elif (gy - offset_y) % scale_y == 0:
+                line = left[:]
+                for px in self._chip8_core.display[cy]:
+                    line += (0x7FFF if px else 0x0000,) * scale_x
+                line += right
+            start = gy * 240
+            if fb[start:start + 240] != line:
+                fb[start:start + 240] = line
+                if first_dirty < 0:
+                    first_dirty = gy
+                last_dirty = gy
+                
+        if first_dirty >= 0:
+            self.ppu.mark_dirty(0, first_dirty, 240, last_dirty - first_dirty + 1)
             
-        # Draw scaled CHIP-8 display
-        for cy in range(32):
-            for cx in range(64):
-                if self._chip8_core.display[cy][cx]:
-                    # White pixel (RGB555)
-                    color = 0x7FFF
-                    
-                    # Draw scaled pixel
-                    for dy in range(scale_y):
-                        for dx in range(scale_x):
-                            gx = offset_x + cx * scale_x + dx
-                            gy = offset_y + cy * scale_y + dy
-                            if 0 <= gx < 240 and 0 <= gy < 160:
-                                self.ppu.framebuffer[gy * 240 + gx] = color
-                                
     def save_state(self) -> bytes:
         """Create save state"""
         state = {
@@ -695,21 +725,25 @@ class GBADisplayWidget(QtWidgets.QWidget):
     def sizeHint(self):
         return QtCore.QSize(240*self.scale_factor, 160*self.scale_factor)
         
-    def _update_display(self):
-        """Update display from PPU framebuffer"""
+    def _update_display(self, region: Optional[QtCore.QRect] = None):
+        """Update display from PPU framebuffer (only `region` if given)"""
+        if region is None:
+            x0, y0, x1, y1 = 0, 0, 240, 160
+        else:
+            x0, y0 = region.left(), region.top()
+            x1, y1 = region.right() + 1, region.bottom() + 1
+            
         # Convert RGB555 to RGB888
-        for y in range(160):
-            for x in range(240):
+        for y in range(y0, y1):
+            for x in range(x0, x1):
                 rgb555 = self.core.ppu.framebuffer[y * 240 + x]
                 r = ((rgb555 & 0x1F) * 255) // 31
                 g = (((rgb555 >> 5) & 0x1F) * 255) // 31
                 b = (((rgb555 >> 10) & 0x1F) * 255) // 31
                 self._image.setPixelColor(x, y, QtGui.QColor(r, g, b))
                 
-    def paintEvent(self, event: QtGui.QPaintEvent):
-        painter = QtGui.QPainter(self)
-        painter.fillRect(self.rect(), QtGui.QColor(0, 0, 0))
-        
+    def _target_rect(self) -> QtCore.QRect:
+        """Widget area the 240x160 image is drawn into"""
         if self.maintain_aspect:
             # Scale maintaining aspect ratio
             w = self.width()
@@ -719,9 +753,25 @@ class GBADisplayWidget(QtWidgets.QWidget):
             dest_h = int(160 * scale)
             left = (w - dest_w) // 2
             top = (h - dest_h) // 2
-            target = QtCore.QRect(left, top, dest_w, dest_h)
-        else:
-            target = self.rect()
+            return QtCore.QRect(left, top, dest_w, dest_h)
+        return self.rect()
+        
+    def _widget_rect(self, region: QtCore.QRect) -> QtCore.QRect:
+        """Map a framebuffer region to widget coordinates (rounded outwards)"""
+        target = self._target_rect()
+        sx = target.width() / 240
+        sy = target.height() / 160
+        left = target.left() + int(region.left() * sx)
+        top = target.top() + int(region.top() * sy)
+        right = target.left() + int((region.right() + 1) * sx + 1)
+        bottom = target.top() + int((region.bottom() + 1) * sy + 1)
+        return QtCore.QRect(left, top, right - left, bottom - top)
+        
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor(0, 0, 0))
+        
+        target = self._target_rect()
             
         # Set rendering mode
         if self.use_bilinear:
@@ -737,9 +787,16 @@ class GBADisplayWidget(QtWidgets.QWidget):
             painter.setFont(QtGui.QFont("Consolas", 10))
             painter.drawText(10, 20, f"FPS: {self.fps:.1f}")
             
-    def refresh(self):
-        """Refresh display and calculate FPS"""
-        self._update_display()
+    def refresh(self, region: Optional[QtCore.QRect] = None):
+        """Refresh display and calculate FPS
+        
+        With a `region`, only that part of the framebuffer is converted and
+        repainted; an empty region skips the framebuffer upload entirely.
+        """
+        if region is None:
+            self._update_display()
+        elif not region.isEmpty():
+            self._update_display(region)
         
         # Calculate FPS
         current_time = time.time()
@@ -754,8 +811,18 @@ class GBADisplayWidget(QtWidgets.QWidget):
             avg_frame_time = sum(self.frame_times) / len(self.frame_times)
             self.fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
             
-        self.update()
+        if region is None:
+            self.update()
+            return
+            
+        if not region.isEmpty():
+            self.update(self._widget_rect(region))
+        if self.show_fps:
+            self.update(self.FPS_RECT)
         
+    # Area covered by the FPS overlay text
+    FPS_RECT = QtCore.QRect(0, 0, 120, 30)
+    
     # Input handling
     KEYMAP = {
         Qt.Key_Z: 0,      # A
@@ -845,9 +912,9 @@ class RegistersWidget(QtWidgets.QDockWidget):
         # Update register values
         for i in range(16):
             val = self.core.cpu.r[i] if i < len(self.core.cpu.r) else 0
-            self.reg_table.setItem(i, 1, QtWidgets.QTableWidgetItem(f"0x{val:08X}"))
+            self.reg_table.setItem(i, 1, QtWidgets.QTableWidgetItem("0x%08X" % val))
             
-        self.reg_table.setItem(16, 1, QtWidgets.QTableWidgetItem(f"0x{self.core.cpu.cpsr:08X}"))
+        self.reg_table.setItem(16, 1, QtWidgets.QTableWidgetItem("0x%08X" % self.core.cpu.cpsr))
         self.reg_table.setItem(17, 1, QtWidgets.QTableWidgetItem(str(self.core.total_cycles)))
         
         # Update flags
@@ -856,7 +923,7 @@ class RegistersWidget(QtWidgets.QDockWidget):
         z = 'Z' if cpsr & (1 << 30) else '-'
         c = 'C' if cpsr & (1 << 29) else '-'
         v = 'V' if cpsr & (1 << 28) else '-'
-        self.flags_label.setText(f"Flags: {n}{z}{c}{v}  Mode: 0x{cpsr & 0x1F:02X}")
+        self.flags_label.setText("Flags: %s%s%s%s  Mode: 0x%02X" % (n, z, c, v, cpsr & 0x1F))
 
 class MemoryViewerWidget(QtWidgets.QDockWidget):
     """Memory viewer/hex editor"""
@@ -915,6 +982,93 @@ class MemoryViewerWidget(QtWidgets.QDockWidget):
             
         self.hex_view.setPlainText('\n'.join(lines))
 
+class EmuWorker(QtCore.QObject):
+    """Runs the emulation loop on its own thread; the GUI thread only paints"""
+    
+    # Dirty framebuffer region accumulated since the last delivered frame
+    frame_ready = QtCore.pyqtSignal(QtCore.QRect)
+    
+    FRAME_TIME = 1.0 / 60.0
+    
+    def __init__(self, core: GBACore):
+        super().__init__()
+        self.core = core
+        
+        # Emulation control (written by the GUI thread)
+        self.running = False
+        self.turbo = False
+        self.speed_multiplier = 1.0
+        
+        # Held while the core is being stepped; GUI code that mutates the
+        # core (load/reset/state) must take it too
+        self.lock = threading.RLock()
+        
+        self._stop = False
+        self._frame_pending = False
+        self._pending_rect = QtCore.QRect()
+        
+    @QtCore.pyqtSlot()
+    def run(self):
+        """Paced emulation loop"""
+        next_frame = time.perf_counter()
+        while not self._stop:
+            ran = self.running
+            if ran:
+                with self.lock:
+                    self._run_frames()
+                    self._pending_rect = self._pending_rect.united(self.core.dirty_rect)
+                    self.core.ppu.clear_dirty()
+                    
+            # Coalesce frames while the GUI is still busy with the last one.
+            # Every emulated tick is delivered, even with an empty region, so
+            # registers/status/FPS keep updating on a static screen; while
+            # paused only a leftover region is flushed
+            if not self._frame_pending and (ran or not self._pending_rect.isEmpty()):
+                self._frame_pending = True
+                self.frame_ready.emit(self._pending_rect)
+                self._pending_rect = QtCore.QRect()
+            
+            next_frame += self.FRAME_TIME
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.perf_counter()
+                
+    def _run_frames(self):
+        """Run one tick worth of frames based on speed"""
+        frames = int(self.speed_multiplier)
+        if self.turbo:
+            frames *= 4
+            
+        chip8 = self.core._chip8_core
+        for _ in range(frames):
+            # Run one frame
+            if chip8:
+                # Run CHIP-8 cycles
+                cycles_per_frame = int(700 / 60)  # ~700 Hz
+                for _ in range(cycles_per_frame):
+                    chip8.cycle()
+                    
+                # Tick timers
+                if chip8.state.delay_timer > 0:
+                    chip8.state.delay_timer -= 1
+                if chip8.state.sound_timer > 0:
+                    chip8.state.sound_timer -= 1
+                    
+            self.core.frame_count += 1
+            
+        if chip8 and chip8.draw_flag:
+            self.core._map_chip8_to_gba()
+            chip8.draw_flag = False
+            
+    def frame_consumed(self):
+        """Called by the GUI once it has painted the last frame_ready region"""
+        self._frame_pending = False
+        
+    def stop(self):
+        self._stop = True
+
 class SamsoftMGBAWindow(QtWidgets.QMainWindow):
     """Main Samsoft mGBA-style emulator window"""
     
@@ -947,16 +1101,15 @@ class SamsoftMGBAWindow(QtWidgets.QMainWindow):
         self.memory_viewer = MemoryViewerWidget(self.core, self)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.memory_viewer)
         
-        # Emulation control
-        self.running = False
-        self.turbo = False
+        # Emulation runs on a worker thread; the GUI only paints delivered frames
         self.frame_skip = 0
-        self.speed_multiplier = 1.0
-        
-        # Timing
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self._emulation_step)
-        self.timer.start(16)  # ~60 FPS
+        self._last_status = 0.0
+        self._emu_thread = QtCore.QThread(self)
+        self._worker = EmuWorker(self.core)
+        self._worker.moveToThread(self._emu_thread)
+        self._worker.frame_ready.connect(self._on_frame, Qt.QueuedConnection)
+        self._emu_thread.started.connect(self._worker.run)
+        self._emu_thread.start()
         
         # Recent ROMs
         self.recent_roms = []
@@ -1145,39 +1298,49 @@ class SamsoftMGBAWindow(QtWidgets.QMainWindow):
             act = self.recent_menu.addAction(os.path.basename(rom))
             act.triggered.connect(lambda c, p=rom: self.load_rom(p))
             
-    def _emulation_step(self):
-        """Main emulation loop"""
-        if not self.running:
-            return
-            
-        # Run frames based on speed
-        frames = int(self.speed_multiplier)
-        if self.turbo:
-            frames *= 4
-            
-        for _ in range(frames):
-            # Run one frame
-            if self.core._chip8_core:
-                # Run CHIP-8 cycles
-                cycles_per_frame = int(700 / 60)  # ~700 Hz
-                for _ in range(cycles_per_frame):
-                    self.core._chip8_core.cycle()
-                    
-                # Tick timers
-                if self.core._chip8_core.state.delay_timer > 0:
-                    self.core._chip8_core.state.delay_timer -= 1
-                if self.core._chip8_core.state.sound_timer > 0:
-                    self.core._chip8_core.state.sound_timer -= 1
-                    
-            self.core.frame_count += 1
-            
-        # Update display
-        self.core._map_chip8_to_gba()
-        self.display.refresh()
-        self.registers_widget.refresh()
+    # Emulation control lives on the worker so its loop can read it directly
+    @property
+    def running(self) -> bool:
+        return self._worker.running
+        
+    @running.setter
+    def running(self, value: bool):
+        self._worker.running = value
+        
+    @property
+    def turbo(self) -> bool:
+        return self._worker.turbo
         
-        # Update status
-        if self.core.frame_count % 30 == 0:
+    @turbo.setter
+    def turbo(self, value: bool):
+        self._worker.turbo = value
+        
+    @property
+    def speed_multiplier(self) -> float:
+        return self._worker.speed_multiplier
+        
+    @speed_multiplier.setter
+    def speed_multiplier(self, value: float):
+        self._worker.speed_multiplier = value
+        
+    # Seconds between status bar refreshes while frames are arriving
+    STATUS_INTERVAL = 0.5
+    
+    def _on_frame(self, region: QtCore.QRect):
+        """Paint a frame delivered by the emulation worker"""
+        # Update display (only the part of the framebuffer that changed);
+        # hold the worker lock so the framebuffer and registers aren't
+        # rewritten mid-read
+        with self._worker.lock:
+            self.display.refresh(region)
+            self.registers_widget.refresh()
+        self._worker.frame_consumed()
+        
+        # Update status at a fixed wall-clock rate; frames are coalesced, so
+        # frame_count can't be relied on to hit any particular value
+        now = time.perf_counter()
+        if now - self._last_status >= self.STATUS_INTERVAL:
+            self._last_status = now
             self._update_status()
             
     def _update_status(self):
@@ -1220,7 +1383,8 @@ class SamsoftMGBAWindow(QtWidgets.QMainWindow):
             with open(path, 'rb') as f:
                 rom_data = f.read()
                 
-            self.core.load_rom(rom_data)
+            with self._worker.lock:
+                self.core.load_rom(rom_data)
             self.current_rom = path
             
             # Add to recent
@@ -1256,7 +1420,8 @@ class SamsoftMGBAWindow(QtWidgets.QMainWindow):
     def save_state(self):
         """Save emulation state"""
         try:
-            state = self.core.save_state()
+            with self._worker.lock:
+                state = self.core.save_state()
             path, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, "Save State", "", "Save States (*.sav);;All Files (*)"
             )
@@ -1276,14 +1441,16 @@ class SamsoftMGBAWindow(QtWidgets.QMainWindow):
             try:
                 with open(path, 'rb') as f:
                     state = f.read()
-                self.core.load_state(state)
+                with self._worker.lock:
+                    self.core.load_state(state)
                 self.statusBar().showMessage("State loaded", 2000)
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load state:\n{e}")
                 
     def reset_emulation(self):
         """Reset emulation"""
-        self.core.reset()
+        with self._worker.lock:
+            self.core.reset()
         self._update_status()
         
     def toggle_pause(self):
@@ -1323,6 +1490,13 @@ class SamsoftMGBAWindow(QtWidgets.QMainWindow):
         self.display.use_bilinear = not self.display.use_bilinear
         self.display.update()
         
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        """Stop the emulation thread before the window goes away"""
+        self._worker.stop()
+        self._emu_thread.quit()
+        self._emu_thread.wait()
+        super().closeEvent(event)
+        
     def show_about(self):
         """Show about dialog"""
         QtWidgets.QMessageBox.about(
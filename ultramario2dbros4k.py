@@ -1,6 +1,22 @@
 import pygame
 import sys
 import random
+import warnings
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    warnings.warn("numba not installed; player and enemy physics run as plain Python (slower)")
+
+    def njit(*args, **kwargs):
+        # Stand-in for numba.njit: hand back the function unchanged
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # Initialize Pygame
 pygame.init()
@@ -35,6 +51,13 @@ GRAVITY = 0.6  # Slightly reduced gravity
 PLAYER_SPEED = 4  # Slightly reduced speed
 JUMP_POWER = -14  # Slightly reduced jump power
 ENEMY_SPEED = 1.5  # Slightly reduced enemy speed
+ACTIVE_MARGIN = SCREEN_WIDTH // 2  # Enemies further than this outside the view stand still
+
+# Flame particles
+MAX_PARTICLES = 60  # Cap on live flame particles
+FLAME_SPAWN_CHANCE = 0.3  # Average particles spawned per frame
+FLAME_BURST_FRAMES = 10  # Particles are spawned in one batch every N frames
+FLAME_POOL = 1024  # Spawn values pre-sampled per RNG refill
 
 # Game states
 STATE_OVERWORLD = 0
@@ -43,10 +66,20 @@ STATE_LEVEL_COMPLETE = 2
 STATE_GAME_OVER = 3
 STATE_WIN = 4
 
+MAX_LEVEL = 8
+
+# HUD labels
+SCORE_FMT = "SCORE: %d"
+LIVES_FMT = "LIVES: %d"
+LEVEL_FMT = "LEVEL: %d"
+WORLD_FMT = "WORLD 1-%d"
+COINS_FMT = "COINS: %d"
+
 # Set up the display
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("ULTRA MARIO 2D BROS")
 clock = pygame.time.Clock()
+rng = np.random.default_rng()
 
 # Try to load a pixel font, fall back to system font
 try:
@@ -54,6 +87,16 @@ try:
 except:
     font = pygame.font.SysFont("Arial", 12, bold=True)
 
+@lru_cache(maxsize=512)
+def render_text(text, color=WHITE):
+    # HUD strings repeat frame after frame; render each one once
+    return font.render(text, True, color).convert_alpha()
+
+@lru_cache(maxsize=512)
+def render_value(fmt, value):
+    # Keyed on the format and number, so a cache hit builds no string at all
+    return render_text(fmt % value)
+
 # Create surfaces for game elements (sizes based on TILE_SIZE=24)
 def create_block_surface():
     block = pygame.Surface((TILE_SIZE, TILE_SIZE))
@@ -120,50 +163,71 @@ def create_coin_surface():
     pygame.draw.ellipse(coin, (220, 180, 0), (1, 4, TILE_SIZE//2-2, TILE_SIZE-8))  # Adjusted
     return coin
 
+# Mario's NES-style sprite as pixel art, one character per pixel
+MARIO_PALETTE = {
+    ".": bytes(4),  # Transparent
+    "R": bytes((*MARIO_RED, 255)),  # Hat and shirt
+    "H": bytes((*MARIO_BROWN, 255)),  # Hair
+    "S": bytes((255, 180, 180, 255)),  # Face and arms
+    "K": bytes((*BLACK, 255)),  # Eyes, mustache and shoes
+    "B": bytes((*MARIO_BLUE, 255)),  # Overalls
+    "Y": bytes((*YELLOW, 255)),  # Button
+}
+MARIO_SPRITE = (
+    "........................",
+    "........................",
+    "........................",
+    "....HHHHRRRRRRRRHHHH....",
+    "....HHHHRRRRRRRRHHHH....",
+    "....RRRRRRRRRRRRRRRR....",
+    "....RRRRRRRRRRRRRRRR....",
+    "....RRRRRRRRRRRRRRRR....",
+    "....RRRRRRRRRRRRRRRR....",
+    "....RRRRRRRRRRRRRRRR....",
+    "....RRRRRRRRRRRRRRRR....",
+    "....SSSSSSSSSSSSSSSS....",
+    "....SSSSSSSSSSSSSSSS....",
+    "....SSSSKKSSSSKKSSSS....",
+    "....SSSSKKSSSSKKSSSS....",
+    "....SSSSKKKKKKKKSSSS....",
+    "....SSSSKKKKKKKKSSSS....",
+    "....SSSSSSSSSSSSSSSS....",
+    "....SSSSSSSSSSSSSSSS....",
+    "..SSSBBBBBBBBBBBBBBSSS..",
+    "..SSSBBBBBBBBBBBBBBSSS..",
+    "..SSSBBBBBBBBBBBBBBSSS..",
+    "..SSSBBBBBBBBBBBBBBSSS..",
+    "..SSSBBBBBBBBBBBBBBSSS..",
+    "..SSSBBBBBBYYBBBBBBSSS..",
+    "....BBBBBBBYYBBBBBBB....",
+    "....BBBBBBBBBBBBBBBB....",
+    "....BBBBBBBBBBBBBBBB....",
+    "....BBBBBBBBBBBBBBBB....",
+    "....BBBBBBBBBBBBBBBB....",
+    "....BBBBBBBBBBBBBBBB....",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "......BBBB....BBBB......",
+    "....KKKKKKKKKKKKKKKK....",
+    "....KKKKKKKKKKKKKKKK....",
+    "....KKKKKKKKKKKKKKKK....",
+    "....KKKKKKKKKKKKKKKK....",
+    "........................",
+    "........................",
+    "........................",
+    "........................",
+)
+
 def create_mario_surface():
-    # Create a surface with transparency
-    mario = pygame.Surface((TILE_SIZE, TILE_SIZE*2), pygame.SRCALPHA)
-    
-    # Draw Mario in NES style - more accurate to original
-    # Hat/head
-    pygame.draw.rect(mario, MARIO_RED, (4, 3, 16, 8))  # Hat
-    pygame.draw.rect(mario, (255, 180, 180), (4, 11, 16, 8))  # Face
-    
-    # Eyes
-    pygame.draw.rect(mario, BLACK, (8, 13, 2, 2))  # Left eye
-    pygame.draw.rect(mario, BLACK, (14, 13, 2, 2))  # Right eye
-    
-    # Mustache
-    pygame.draw.rect(mario, BLACK, (8, 15, 8, 2))
-    
-    # Hair
-    pygame.draw.rect(mario, MARIO_BROWN, (4, 3, 4, 2))
-    pygame.draw.rect(mario, MARIO_BROWN, (16, 3, 4, 2))
-    
-    # Body
-    pygame.draw.rect(mario, MARIO_RED, (4, 19, 16, 8))  # Shirt
-    
-    # Overalls
-    pygame.draw.rect(mario, MARIO_BLUE, (4, 19, 16, 12))
-    pygame.draw.rect(mario, MARIO_BLUE, (4, 19, 6, 12))  # Left strap
-    pygame.draw.rect(mario, MARIO_BLUE, (14, 19, 6, 12))  # Right strap
-    
-    # Button
-    pygame.draw.rect(mario, YELLOW, (11, 24, 2, 2))
-    
-    # Arms
-    pygame.draw.rect(mario, (255, 180, 180), (2, 19, 3, 6))  # Left arm
-    pygame.draw.rect(mario, (255, 180, 180), (19, 19, 3, 6))  # Right arm
-    
-    # Legs
-    pygame.draw.rect(mario, MARIO_BLUE, (6, 31, 4, 9))  # Left leg
-    pygame.draw.rect(mario, MARIO_BLUE, (14, 31, 4, 9))  # Right leg
-    
-    # Shoes
-    pygame.draw.rect(mario, BLACK, (4, 40, 8, 4))  # Left shoe
-    pygame.draw.rect(mario, BLACK, (12, 40, 8, 4))  # Right shoe
-    
-    return mario
+    # Decode the pixel art straight into an RGBA buffer: no draw calls at all
+    pixels = b"".join(MARIO_PALETTE[c] for row in MARIO_SPRITE for c in row)
+    return pygame.image.frombytes(pixels, (TILE_SIZE, TILE_SIZE*2), "RGBA")
 
 def create_flag_surface():
     flag = pygame.Surface((TILE_SIZE, TILE_SIZE*4), pygame.SRCALPHA)  # Slightly shorter flagpole for 400px height
@@ -198,11 +262,151 @@ def create_flame_particle():
     pygame.draw.circle(particle, FLAME_YELLOW, (1, 1), 1)  # Smaller circle
     return particle
 
+# Shared sprite images - drawn once and converted to the display format,
+# every sprite of a kind references the same surface
+GROUND_SURF = create_ground_surface().convert()
+BLOCK_SURF = create_block_surface().convert()
+QUESTION_SURF = create_question_block_surface().convert()
+PIPE_SURF = create_pipe_surface().convert()
+# Grass and path get a few random-detail variants, picked per tile position
+GRASS_VARIANTS = [create_grass_surface().convert() for _ in range(4)]
+PATH_VARIANTS = [create_path_surface().convert() for _ in range(4)]
+GOOMBA_SURF = create_goomba_surface().convert_alpha()
+KOOPA_SURF = create_koopa_surface().convert_alpha()
+COIN_SURF = create_coin_surface().convert_alpha()
+MARIO_SURF = create_mario_surface().convert_alpha()
+FLAG_SURF = create_flag_surface().convert_alpha()
+FLAME_SURF = create_flame_particle().convert_alpha()
+ENEMY_SURFS = {"goomba": GOOMBA_SURF, "koopa": KOOPA_SURF}
+
+def tile_variant(variants, x, y):
+    # Same position, same variant: int tuples hash deterministically
+    return variants[hash((x, y)) % len(variants)]
+
+class SpatialHashGrid:
+    # Uniform grid: cell (x // cell, y // cell) -> items whose rect touches it
+    def __init__(self, cell=TILE_SIZE):
+        self.cell = cell
+        self.cells = defaultdict(list)
+
+    def keys(self, rect):
+        cell = self.cell
+        for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+            for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                yield (cx, cy)
+
+    def insert(self, item, rect):
+        for key in self.keys(rect):
+            self.cells[key].append(item)
+
+    def remove(self, item, rect):
+        cells = self.cells
+        for key in self.keys(rect):
+            cell = cells[key]
+            cell.remove(item)
+            if not cell:
+                del cells[key]  # Keep lookups on emptied cells a plain miss
+
+    def collide(self, rect):
+        # Items (anything with a .rect) overlapping rect, tested per cell in C
+        found = []
+        cells = self.cells
+        for key in self.keys(rect):
+            cell = cells.get(key)
+            if cell:
+                for index in rect.collidelistall(cell):
+                    if cell[index] not in found:
+                        found.append(cell[index])
+        return found
+
+# Collision resolution kernels over the ground strip (x, y, w, h) plus a window
+# of the level's other tiles (x, y, w, h, level index as int32, sorted by x).
+# The ground wins, then - like a scan in level order - the overlapping tile
+# with the lowest level index is the one that pushes us.
+@njit(cache=True)
+def first_overlap(px, py, pw, ph, ground, tile_xs, tile_ys, tile_ws, tile_hs, tile_order):
+    gx, gy, gw, gh = ground
+    if px < gx + gw and px + pw > gx and py < gy + gh and py + ph > gy:
+        return True, gx, gy, gw, gh
+    hit = -1
+    for i in range(tile_xs.shape[0]):
+        if (px < tile_xs[i] + tile_ws[i] and px + pw > tile_xs[i]
+                and py < tile_ys[i] + tile_hs[i] and py + ph > tile_ys[i]):
+            if hit == -1 or tile_order[i] < tile_order[hit]:
+                hit = i
+    if hit == -1:
+        return False, 0, 0, 0, 0
+    return True, tile_xs[hit], tile_ys[hit], tile_ws[hit], tile_hs[hit]
+
+@njit(cache=True)
+def resolve_horizontal(px, py, pw, ph, vx, ground, tile_xs, tile_ys, tile_ws, tile_hs, tile_order):
+    if vx != 0:
+        found, tx, ty, tw, th = first_overlap(px, py, pw, ph, ground,
+                                              tile_xs, tile_ys, tile_ws, tile_hs, tile_order)
+        if found:
+            if vx > 0:
+                px = tx - pw
+            else:
+                px = tx + tw
+    return px
+
+@njit(cache=True)
+def resolve_vertical(px, py, pw, ph, vy, ground, tile_xs, tile_ys, tile_ws, tile_hs, tile_order):
+    on_ground = False
+    if vy != 0:
+        found, tx, ty, tw, th = first_overlap(px, py, pw, ph, ground,
+                                              tile_xs, tile_ys, tile_ws, tile_hs, tile_order)
+        if found:
+            if vy > 0:
+                py = ty - ph
+                on_ground = True
+            else:
+                py = ty + th
+            vy = 0.0
+    return py, vy, on_ground
+
+@njit(cache=True)
+def overlaps_tile(x, y, w, h, max_tile_width, ground, tile_xs, tile_ys, tile_ws, tile_hs):
+    gx, gy, gw, gh = ground
+    if x < gx + gw and x + w > gx and y < gy + gh and y + h > gy:
+        return True
+    # Only tiles starting within max_tile_width left of x can reach the box
+    lo = np.searchsorted(tile_xs, x - max_tile_width)
+    hi = np.searchsorted(tile_xs, x + w)
+    for i in range(lo, hi):
+        if (x < tile_xs[i] + tile_ws[i] and x + w > tile_xs[i]
+                and y < tile_ys[i] + tile_hs[i] and y + h > tile_ys[i]):
+            return True
+    return False
+
+@njit(cache=True)
+def step_enemies(xs, ys, ws, hs, directions, alive, moved, left, right, speed,
+                 max_tile_width, ground, tile_xs, tile_ys, tile_ws, tile_hs):
+    # Walk every live enemy inside [left, right): turn at walls and platform edges
+    for k in range(xs.shape[0]):
+        moved[k] = alive[k] and xs[k] < right and xs[k] + ws[k] > left
+        if not moved[k]:
+            continue
+        direction = directions[k]
+        # Rect coordinates round half away from zero
+        new_x = xs[k] + direction * speed
+        x = int(new_x + 0.5) if new_x >= 0 else -int(0.5 - new_x)
+        if overlaps_tile(x, ys[k], ws[k], hs[k], max_tile_width, ground,
+                         tile_xs, tile_ys, tile_ws, tile_hs):
+            direction = -direction
+        # 1x1 probe just below the leading corner (adjusted check distance)
+        probe_x = x if direction < 0 else x + ws[k]
+        if not overlaps_tile(probe_x, ys[k] + hs[k] + 3, 1, 1, max_tile_width, ground,
+                             tile_xs, tile_ys, tile_ws, tile_hs):
+            direction = -direction
+        xs[k] = x
+        directions[k] = direction
+
 # Game classes (Logic mostly unchanged, positions/sizes use TILE_SIZE)
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = create_mario_surface()
+        self.image = MARIO_SURF
         self.rect = self.image.get_rect(topleft=(x, y))
         self.vel_x = 0
         self.vel_y = 0
@@ -211,151 +415,187 @@ class Player(pygame.sprite.Sprite):
         self.coins_collected = 0
         self.enemies_defeated = 0
 
-    def update(self, tiles, enemies, coins, flag):
-        # Apply gravity
-        self.vel_y += GRAVITY
-        if self.vel_y > 10:
-            self.vel_y = 10
+    def update(self, ground, tile_arrays, enemies, coin_grid, flag):
+        # Hot path: work on locals and write velocity back once
+        rect = self.rect
 
-        # Move horizontally
-        self.rect.x += self.vel_x
-        self.check_horizontal_collisions(tiles)
+        # Apply gravity, capped at terminal velocity
+        vel_y = min(self.vel_y + GRAVITY, 10)
 
-        # Move vertically
-        self.rect.y += self.vel_y
-        self.on_ground = False
-        self.check_vertical_collisions(tiles)
-
-        # Check for enemy collisions
-        for enemy in enemies:
-            if self.rect.colliderect(enemy.rect):
-                if self.vel_y > 0 and self.rect.bottom < enemy.rect.centery:
-                    enemy.kill()
-                    self.vel_y = -6  # Slightly reduced bounce
-                    self.enemies_defeated += 1
-                    return (STATE_PLAYING, 0, 200)  # 200 points for defeating enemy
-                else:
-                    return (STATE_GAME_OVER, 0, 0)
+        # Move horizontally
+        rect.x += self.vel_x
+        self.check_horizontal_collisions(rect, ground, tile_arrays)
+
+        # Move vertically (the kernel also reports on_ground)
+        rect.y += vel_y
+        vel_y = self.check_vertical_collisions(rect, vel_y, ground, tile_arrays)
+
+        # Check for enemy collisions (the scan over enemy rects runs in C)
+        enemy_list = enemies.sprites()
+        index = rect.collidelist(enemy_list)
+        if index != -1:
+            enemy = enemy_list[index]
+            if vel_y > 0 and rect.bottom < enemy.rect.centery:
+                enemy.kill()
+                self.vel_y = -6  # Slightly reduced bounce
+                self.enemies_defeated += 1
+                return (STATE_PLAYING, 0, 200)  # 200 points for defeating enemy
+            else:
+                self.vel_y = vel_y
+                return (STATE_GAME_OVER, 0, 0)
+        self.vel_y = vel_y
 
         # Check for coin collisions
-        coins_collected = pygame.sprite.spritecollide(self, coins, True)
+        coins_collected = coin_grid.collide(rect)
         if coins_collected:
+            for coin in coins_collected:
+                coin_grid.remove(coin, coin.rect)
+                coin.kill()
             self.coins_collected += len(coins_collected)
             return (STATE_PLAYING, len(coins_collected) * 100, 0)  # 100 points per coin
 
         # Check for flag collision
-        if pygame.sprite.collide_rect(self, flag):
+        if rect.colliderect(flag.rect):
             return (STATE_LEVEL_COMPLETE, 0, 0)
 
         # Check if fell off the screen
-        if self.rect.top > SCREEN_HEIGHT:
+        if rect.top > SCREEN_HEIGHT:
             return (STATE_GAME_OVER, 0, 0)
 
         return (STATE_PLAYING, 0, 0)
 
-    def check_horizontal_collisions(self, tiles):
-        for tile in tiles:
-            if self.rect.colliderect(tile.rect):
-                if self.vel_x > 0:
-                    self.rect.right = tile.rect.left
-                elif self.vel_x < 0:
-                    self.rect.left = tile.rect.right
-
-    def check_vertical_collisions(self, tiles):
-        for tile in tiles:
-            if self.rect.colliderect(tile.rect):
-                if self.vel_y > 0:
-                    self.rect.bottom = tile.rect.top
-                    self.vel_y = 0
-                    self.on_ground = True
-                elif self.vel_y < 0:
-                    self.rect.top = tile.rect.bottom
-                    self.vel_y = 0
-
-class Tile(pygame.sprite.Sprite):
-    def __init__(self, x, y, surface):
-        super().__init__()
-        self.image = surface
-        self.rect = self.image.get_rect(topleft=(x, y))
+    def check_horizontal_collisions(self, rect, ground, tile_arrays):
+        rect.x = resolve_horizontal(rect.x, rect.y, rect.width, rect.height,
+                                    self.vel_x, ground, *tile_arrays)
+
+    def check_vertical_collisions(self, rect, vel_y, ground, tile_arrays):
+        rect.y, vel_y, self.on_ground = resolve_vertical(
+            rect.x, rect.y, rect.width, rect.height, float(vel_y), ground, *tile_arrays)
+        return vel_y
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, enemy_type="goomba"):
         super().__init__()
-        if enemy_type == "goomba":
-            self.image = create_goomba_surface()
-        else:  # koopa
-            self.image = create_koopa_surface()
+        self.image = ENEMY_SURFS[enemy_type]
         self.rect = self.image.get_rect(topleft=(x, y))
         self.direction = -1
-        self.speed = ENEMY_SPEED
         self.enemy_type = enemy_type
-
-    def update(self, tiles):
-        self.rect.x += self.direction * self.speed
-
-        # Check for collisions with tiles
-        for tile in tiles:
-            if self.rect.colliderect(tile.rect):
-                self.direction *= -1
-                break
-
-        # Check if at edge of platform
-        check_x = self.rect.left if self.direction < 0 else self.rect.right
-        check_y = self.rect.bottom + 3  # Adjusted check distance
-        edge_check = pygame.Rect(check_x, check_y, 1, 1)
-
-        on_platform = False
-        for tile in tiles:
-            if edge_check.colliderect(tile.rect):
-                on_platform = True
-                break
-
-        if not on_platform:
-            self.direction *= -1
+        self.index = -1  # Slot in EnemyGroup's arrays
 
 class Coin(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = create_coin_surface()
+        self.image = COIN_SURF
         self.rect = self.image.get_rect(topleft=(x, y))
 
 class Flag(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = create_flag_surface()
+        self.image = FLAG_SURF
         self.rect = self.image.get_rect(bottomleft=(x, y))
 
+def build_level_node_surface(level_num):
+    surface = pygame.Surface((TILE_SIZE*2, TILE_SIZE*2), pygame.SRCALPHA)
+    pygame.draw.rect(surface, PURPLE, (0, 0, TILE_SIZE*2, TILE_SIZE*2), border_radius=6)  # Slightly smaller radius
+    pygame.draw.rect(surface, (180, 100, 220), (3, 3, TILE_SIZE*2-6, TILE_SIZE*2-6), border_radius=5)  # Adjusted
+    level_text = font.render(str(level_num), True, WHITE)
+    text_x = TILE_SIZE - level_text.get_width()//2
+    text_y = TILE_SIZE - level_text.get_height()//2
+    # Ensure text doesn't go out of bounds
+    text_x = max(0, min(text_x, TILE_SIZE*2 - level_text.get_width()))
+    text_y = max(0, min(text_y, TILE_SIZE*2 - level_text.get_height()))
+    surface.blit(level_text, (text_x, text_y))
+    return surface.convert_alpha()
+
+# One node image per level number, shared across overworld rebuilds
+LEVEL_NODE_SURFS = {level_num: build_level_node_surface(level_num)
+                    for level_num in range(1, MAX_LEVEL + 1)}
+
 class LevelNode(pygame.sprite.Sprite):
     def __init__(self, x, y, level_num):
         super().__init__()
-        self.image = pygame.Surface((TILE_SIZE*2, TILE_SIZE*2), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, PURPLE, (0, 0, TILE_SIZE*2, TILE_SIZE*2), border_radius=6)  # Slightly smaller radius
-        pygame.draw.rect(self.image, (180, 100, 220), (3, 3, TILE_SIZE*2-6, TILE_SIZE*2-6), border_radius=5)  # Adjusted
-        level_text = font.render(str(level_num), True, WHITE)
-        text_x = TILE_SIZE - level_text.get_width()//2
-        text_y = TILE_SIZE - level_text.get_height()//2
-        # Ensure text doesn't go out of bounds
-        text_x = max(0, min(text_x, TILE_SIZE*2 - level_text.get_width()))
-        text_y = max(0, min(text_y, TILE_SIZE*2 - level_text.get_height()))
-        self.image.blit(level_text, (text_x, text_y))
+        self.image = LEVEL_NODE_SURFS[level_num]
         self.rect = self.image.get_rect(center=(x, y))
         self.level_num = level_num
 
-class FlameParticle(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = create_flame_particle()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.vel_x = random.uniform(-1, 1)
-        self.vel_y = random.uniform(-3, -1)
-        self.lifetime = random.randint(15, 30)  # Slightly reduced lifetime
+class FlameParticles:
+    # All flame particles as numpy arrays: (x, y) centre and velocity rows, frames left
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.pos = np.empty((capacity, 2), dtype=np.float32)
+        self.vel = np.empty((capacity, 2), dtype=np.float32)
+        self.lifetime = np.empty(capacity, dtype=np.int16)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, xs, ys, vel_xs, vel_ys, lifetimes):
+        start = self.count
+        end = min(start + len(xs), len(self.lifetime))
+        taken = end - start
+        self.pos[start:end, 0] = xs[:taken]
+        self.pos[start:end, 1] = ys[:taken]
+        self.vel[start:end, 0] = vel_xs[:taken]
+        self.vel[start:end, 1] = vel_ys[:taken]
+        self.lifetime[start:end] = lifetimes[:taken]
+        self.count = end
 
     def update(self):
-        self.rect.x += self.vel_x
-        self.rect.y += self.vel_y
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
+        n = self.count
+        self.pos[:n] += self.vel[:n]
+        self.lifetime[:n] -= 1
+
+        # Compact the survivors to the front of the arrays
+        alive = self.lifetime[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for arr in (self.pos, self.vel, self.lifetime):
+                arr[:survivors] = arr[:n][alive]
+            self.count = survivors
+
+    def draw(self, surface):
+        # FLAME_SURF is 3x3, so its top-left sits one pixel up/left of the centre
+        positions = (self.pos[:self.count] - 1).astype(np.int32).tolist()
+        surface.blits(((FLAME_SURF, pos) for pos in positions), False)
+
+class CameraGroup(pygame.sprite.Group):
+    # Group whose draw() shifts sprites by the camera, culls against the
+    # viewport in C (collidelistall) and blits the rest in one C-side call
+    def draw(self, surface, camera_x=0):
+        sprites = self.sprites()
+        visible = surface.get_rect(x=camera_x).collidelistall(sprites)
+        surface.blits(((s.image, (s.rect.x - camera_x, s.rect.y))
+                       for s in map(sprites.__getitem__, visible)), False)
+
+class EnemyGroup(pygame.sprite.Group):
+    # Enemy sprites plus their positions and directions as parallel numpy
+    # arrays; step_enemies moves them all at once and the rects follow
+    def freeze(self):
+        # Call once every enemy of the level has been added
+        self.members = self.sprites()
+        for index, enemy in enumerate(self.members):
+            enemy.index = index
+        rects = [enemy.rect for enemy in self.members]
+        self.x = np.array([r.x for r in rects], dtype=np.int32)
+        self.y = np.array([r.y for r in rects], dtype=np.int32)
+        self.w = np.array([r.width for r in rects], dtype=np.int32)
+        self.h = np.array([r.height for r in rects], dtype=np.int32)
+        self.direction = np.array([enemy.direction for enemy in self.members], dtype=np.int32)
+        self.alive = np.ones(len(rects), dtype=np.bool_)
+        self.moved = np.zeros(len(rects), dtype=np.bool_)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if sprite.index >= 0:
+            self.alive[sprite.index] = False
+
+    def update(self, ground, tile_arrays, max_tile_width, left, right):
+        step_enemies(self.x, self.y, self.w, self.h, self.direction, self.alive, self.moved,
+                     left, right, ENEMY_SPEED, max_tile_width, ground, *tile_arrays[:4])
+        members = self.members
+        xs = self.x
+        for index in np.flatnonzero(self.moved).tolist():
+            members[index].rect.x = xs[index]
 
 # Game setup
 class Game:
@@ -363,22 +603,35 @@ class Game:
         self.score = 0
         self.lives = 3
         self.level = 1
-        self.max_level = 8
+        self.max_level = MAX_LEVEL
         self.game_state = STATE_OVERWORLD
         self.initial_coin_count = 0
-        self.flame_particles = pygame.sprite.Group()
+        self.flame_particles = FlameParticles()
+        self.flame_timer = 0
+        self._refill_flame_pool()
+
+        # Fixed messages never change, so render them once
+        self.messages = {text: render_text(text) for text in (
+            "GAME OVER", "OUT OF LIVES", "LEVEL COMPLETE!", "YOU WIN!", "PRESS ENTER",
+            "ARROWS: NAVIGATE  ENTER: SELECT")}
+        self.title_font = pygame.font.SysFont("Arial", 28, bold=True)  # Smaller title font
+        self.title_surf = self.title_font.render("ULTRA MARIO 2D BROS", True, RED).convert_alpha()
+        # Dimming layer behind game state messages
+        self._msg_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._msg_overlay.fill((0, 0, 0, 150))
+        self._msg_overlay = self._msg_overlay.convert_alpha()
         self.create_overworld()
 
     def create_overworld(self):
         self.overworld_sprites = pygame.sprite.Group()
-        self.level_nodes = pygame.sprite.Group()
+        # Terrain tiles are only baked into the background: (image, position) pairs
+        terrain = []
 
         # Create overworld terrain (adjusted for 600x400)
         for x in range(0, SCREEN_WIDTH, TILE_SIZE):
             for y in range(SCREEN_HEIGHT - TILE_SIZE*2, SCREEN_HEIGHT, TILE_SIZE):  # Reduced height
                 if (x // TILE_SIZE) % 2 == 0 and (y // TILE_SIZE) % 2 == 0:
-                    tile = Tile(x, y, create_grass_surface())
-                    self.overworld_sprites.add(tile)
+                    terrain.append((tile_variant(GRASS_VARIANTS, x, y), (x, y)))
 
         # Create path (adjusted positions for 600x400)
         path_points = [
@@ -394,13 +647,11 @@ class Game:
             if start_x == end_x:  # Vertical path
                 step = TILE_SIZE if start_y < end_y else -TILE_SIZE
                 for y in range(start_y, end_y, step):
-                    tile = Tile(start_x, y, create_path_surface())
-                    self.overworld_sprites.add(tile)
+                    terrain.append((tile_variant(PATH_VARIANTS, start_x, y), (start_x, y)))
             else:  # Horizontal path
                 step = TILE_SIZE if start_x < end_x else -TILE_SIZE
                 for x in range(start_x, end_x, step):
-                    tile = Tile(x, start_y, create_path_surface())
-                    self.overworld_sprites.add(tile)
+                    terrain.append((tile_variant(PATH_VARIANTS, x, start_y), (x, start_y)))
 
         # Create level nodes (adjusted positions)
         level_positions = [
@@ -408,11 +659,19 @@ class Game:
             (400, 220), (480, 280), (560, 280)
         ]
 
+        self.level_nodes_list = []
         for i, pos in enumerate(level_positions):
             node = LevelNode(pos[0], pos[1], i+1)
-            self.level_nodes.add(node)
+            self.level_nodes_list.append(node)
             self.overworld_sprites.add(node)
 
+        # Terrain, path and nodes never move: pre-compose them into one surface
+        self.overworld_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.overworld_bg.fill(SKY_BLUE)
+        self.overworld_bg.blits(terrain, False)
+        self.overworld_sprites.draw(self.overworld_bg)
+        self.overworld_sprites.empty()
+
         # Create player on overworld
         self.overworld_player = Player(80, 350 - TILE_SIZE*2)  # Adjusted start position
         self.overworld_sprites.add(self.overworld_player)
@@ -421,50 +680,89 @@ class Game:
         self.current_node = 1
 
     def reset_level(self):
-        self.all_sprites = pygame.sprite.Group()
-        self.tiles = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.all_sprites = CameraGroup()
+        # Static tiles are plain parallel lists: they are never removed, only
+        # collided against and baked into the background
+        self.tile_rects = []
+        self.tile_images = []
+        self.enemies = EnemyGroup()
         self.coins = pygame.sprite.Group()
 
         # Create level layout based on level number (adjusted width for 600x400)
         level_width = SCREEN_WIDTH * (1 + self.level // 2)  # Scaled down level width
 
-        for x in range(0, level_width, TILE_SIZE):
-            # Ground
-            self.tiles.add(Tile(x, SCREEN_HEIGHT - TILE_SIZE, create_ground_surface()))
-
-            # Random platforms
-            if random.random() < 0.2 and x > SCREEN_WIDTH//2 and x < level_width - SCREEN_WIDTH//2:  # Adjusted spawn range
-                height = random.randint(3, 5)  # Slightly reduced max height
-                for y in range(SCREEN_HEIGHT - TILE_SIZE * height, SCREEN_HEIGHT - TILE_SIZE, TILE_SIZE):
-                    self.tiles.add(Tile(x, y, create_block_surface()))
-
-                # Add coins on platforms
-                if random.random() < 0.7:
-                    self.coins.add(Coin(x + TILE_SIZE//4, SCREEN_HEIGHT - TILE_SIZE * height - TILE_SIZE//2))
-
-                # Add enemies on platforms
-                if random.random() < 0.4:
-                    enemy_type = "koopa" if self.level > 3 else "goomba"
-                    self.enemies.add(Enemy(x, SCREEN_HEIGHT - TILE_SIZE * height - TILE_SIZE, enemy_type))
+        # Ground: one solid strip across the level, collided against as a single rect
+        self.ground = (0, SCREEN_HEIGHT - TILE_SIZE, level_width, TILE_SIZE)
+        ground_strip = pygame.Surface((level_width, TILE_SIZE)).convert()
+        ground_strip.blits(((GROUND_SURF, (x, 0)) for x in range(0, level_width, TILE_SIZE)), False)
+
+        # Random platforms: every column's rolls are drawn up front in one batch
+        columns = np.arange(0, level_width, TILE_SIZE)
+        platform_mask = ((rng.random(len(columns)) < 0.2)
+                         & (columns > SCREEN_WIDTH//2) & (columns < level_width - SCREEN_WIDTH//2))  # Adjusted spawn range
+        heights = rng.integers(3, 5, len(columns), endpoint=True).tolist()  # Slightly reduced max height
+        coin_mask = (rng.random(len(columns)) < 0.7).tolist()
+        enemy_mask = (rng.random(len(columns)) < 0.4).tolist()
+        enemy_type = "koopa" if self.level > 3 else "goomba"
+
+        for i in np.flatnonzero(platform_mask).tolist():
+            x = i * TILE_SIZE
+            height = heights[i]
+            for y in range(SCREEN_HEIGHT - TILE_SIZE * height, SCREEN_HEIGHT - TILE_SIZE, TILE_SIZE):
+                self.add_tile(x, y, BLOCK_SURF)
+
+            # Add coins on platforms
+            if coin_mask[i]:
+                self.coins.add(Coin(x + TILE_SIZE//4, SCREEN_HEIGHT - TILE_SIZE * height - TILE_SIZE//2))
+
+            # Add enemies on platforms
+            if enemy_mask[i]:
+                self.enemies.add(Enemy(x, SCREEN_HEIGHT - TILE_SIZE * height - TILE_SIZE, enemy_type))
 
         # Add pipes (adjusted position)
         pipe_x = SCREEN_WIDTH + 100
-        self.tiles.add(Tile(pipe_x, SCREEN_HEIGHT - TILE_SIZE*2, create_pipe_surface()))
+        self.add_tile(pipe_x, SCREEN_HEIGHT - TILE_SIZE*2, PIPE_SURF)
 
         # Add question blocks
-        for x in range(SCREEN_WIDTH//2, level_width - SCREEN_WIDTH//2, 150):  # Adjusted spacing
-            if random.random() < 0.6:
-                y = SCREEN_HEIGHT - TILE_SIZE * random.randint(3, 4)  # Slightly reduced max height
-                self.tiles.add(Tile(x, y, create_question_block_surface()))
+        block_xs = range(SCREEN_WIDTH//2, level_width - SCREEN_WIDTH//2, 150)  # Adjusted spacing
+        block_mask = (rng.random(len(block_xs)) < 0.6).tolist()
+        block_heights = rng.integers(3, 4, len(block_xs), endpoint=True).tolist()  # Slightly reduced max height
+        block_coin_mask = (rng.random(len(block_xs)) < 0.5).tolist()
+        for i, x in enumerate(block_xs):
+            if block_mask[i]:
+                y = SCREEN_HEIGHT - TILE_SIZE * block_heights[i]
+                self.add_tile(x, y, QUESTION_SURF)
 
                 # Coin above question block
-                if random.random() < 0.5:
+                if block_coin_mask[i]:
                     self.coins.add(Coin(x + TILE_SIZE//4, y - TILE_SIZE))
 
+        # Coins are hashed once for collision lookups and leave the grid as they are collected
+        self.coin_grid = SpatialHashGrid()
+        for coin in self.coins:
+            self.coin_grid.insert(coin, coin.rect)
+
+        # Static tiles never move: keep them as int32 arrays for the collision kernels...
+        tile_arrays = [
+            np.fromiter((getattr(r, attr) for r in self.tile_rects), np.int32, len(self.tile_rects))
+            for attr in ("x", "y", "width", "height")]
+        tile_arrays.append(np.arange(len(self.tile_rects), dtype=np.int32))
+        # Sorted by x so the tiles around the camera are one bisected slice
+        order = np.argsort(tile_arrays[0], kind="stable")
+        self.tile_arrays = tuple(arr[order] for arr in tile_arrays)
+        self.tile_xs = self.tile_arrays[0].tolist()
+        self.max_tile_width = int(self.tile_arrays[2].max())
+        self.enemies.freeze()
+
+        # ...and pre-blit them into one level-wide background
+        self.static_bg = pygame.Surface((level_width, SCREEN_HEIGHT)).convert()
+        self.static_bg.fill(SKY_BLUE)
+        self.static_bg.blit(ground_strip, (0, SCREEN_HEIGHT - TILE_SIZE))
+        self.static_bg.blits(zip(self.tile_images, self.tile_rects), False)
+
         # Add flag at the end
         self.flag = Flag(level_width - 80, SCREEN_HEIGHT - TILE_SIZE)  # Adjusted position
-        self.all_sprites.add(self.tiles, self.enemies, self.coins, self.flag)
+        self.all_sprites.add(self.enemies, self.coins, self.flag)
 
         # Create player
         self.player = Player(50, SCREEN_HEIGHT - TILE_SIZE * 3)
@@ -473,6 +771,18 @@ class Game:
         self.camera_x = 0
         self.initial_coin_count = len(self.coins)
         self.level_width = level_width
+        self.camera_max = level_width - SCREEN_WIDTH
+
+    def move_to_node(self):
+        # Stand the overworld player on the current level node, if there is one
+        if self.current_node <= len(self.level_nodes_list):
+            node_rect = self.level_nodes_list[self.current_node-1].rect
+            self.overworld_player.rect.centerx = node_rect.centerx
+            self.overworld_player.rect.bottom = node_rect.top
+
+    def add_tile(self, x, y, surface):
+        self.tile_rects.append(surface.get_rect(topleft=(x, y)))
+        self.tile_images.append(surface)
 
     def run(self):
         running = True
@@ -484,19 +794,14 @@ class Game:
 
                 if event.type == pygame.KEYDOWN:
                     if self.game_state == STATE_OVERWORLD:
-                        if event.key == pygame.K_RIGHT and self.current_node < len(self.level_nodes):
+                        if event.key == pygame.K_RIGHT and self.current_node < len(self.level_nodes_list):
                             self.current_node += 1
                             # Move player to next node
-                            nodes = list(self.level_nodes)
-                            if self.current_node <= len(nodes):
-                                self.overworld_player.rect.centerx = nodes[self.current_node-1].rect.centerx
-                                self.overworld_player.rect.bottom = nodes[self.current_node-1].rect.top
+                            self.move_to_node()
                         elif event.key == pygame.K_LEFT and self.current_node > 1:
                             self.current_node -= 1
                             # Move player to previous node
-                            nodes = list(self.level_nodes)
-                            self.overworld_player.rect.centerx = nodes[self.current_node-1].rect.centerx
-                            self.overworld_player.rect.bottom = nodes[self.current_node-1].rect.top
+                            self.move_to_node()
                         elif event.key == pygame.K_RETURN:
                             self.level = self.current_node
                             self.reset_level()
@@ -531,10 +836,7 @@ class Game:
                                     self.game_state = STATE_OVERWORLD
                                     # Move to next level on overworld
                                     self.current_node += 1
-                                    nodes = list(self.level_nodes)
-                                    if self.current_node <= len(nodes):
-                                        self.overworld_player.rect.centerx = nodes[self.current_node-1].rect.centerx
-                                        self.overworld_player.rect.bottom = nodes[self.current_node-1].rect.top
+                                    self.move_to_node()
                                 else:
                                     self.game_state = STATE_WIN
                             elif self.game_state == STATE_WIN:
@@ -548,7 +850,11 @@ class Game:
             # Update game state
             if self.game_state == STATE_PLAYING:
                 # Update player and check game state
-                result = self.player.update(self.tiles, self.enemies, self.coins, self.flag)
+                # Only tiles overlapping the camera span can touch the player
+                lo = bisect_left(self.tile_xs, self.camera_x - self.max_tile_width)
+                hi = bisect_right(self.tile_xs, self.camera_x + SCREEN_WIDTH)
+                visible_tiles = tuple(arr[lo:hi] for arr in self.tile_arrays)
+                result = self.player.update(self.ground, visible_tiles, self.enemies, self.coin_grid, self.flag)
                 game_state, coin_points, enemy_points = result
 
                 # Update score
@@ -557,29 +863,28 @@ class Game:
                 if game_state != STATE_PLAYING:
                     self.game_state = game_state
 
-                # Update enemies
-                self.enemies.update(self.tiles)
+                # Update enemies near the view
+                self.enemies.update(self.ground, self.tile_arrays, self.max_tile_width,
+                                    self.camera_x - ACTIVE_MARGIN,
+                                    self.camera_x + SCREEN_WIDTH + ACTIVE_MARGIN)
 
                 # Update camera to follow player
-                self.camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
-                self.camera_x = max(0, min(self.camera_x, self.level_width - SCREEN_WIDTH))
+                camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
+                self.camera_x = 0 if camera_x < 0 else min(camera_x, self.camera_max)
 
             # Update flame particles
-            if random.random() < 0.3:
-                self.flame_particles.add(FlameParticle(
-                    random.randint(0, SCREEN_WIDTH),
-                    SCREEN_HEIGHT
-                ))
+            self.flame_timer += 1
+            if self.flame_timer >= FLAME_BURST_FRAMES:
+                self.flame_timer = 0
+                self.spawn_flames()
             self.flame_particles.update()
 
             # Draw everything
             if self.game_state == STATE_OVERWORLD:
-                screen.fill(SKY_BLUE)
+                screen.blit(self.overworld_bg, (0, 0))
 
                 # Draw title (adjusted size/position)
-                title_font = pygame.font.SysFont("Arial", 28, bold=True)  # Smaller title font
-                title = title_font.render("ULTRA MARIO 2D BROS", True, RED)
-                screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 15))  # Higher position
+                screen.blit(self.title_surf, (SCREEN_WIDTH//2 - self.title_surf.get_width()//2, 15))  # Higher position
 
                 self.overworld_sprites.draw(screen)
 
@@ -587,15 +892,14 @@ class Game:
                 self.flame_particles.draw(screen)
 
                 # Draw instructions (adjusted position)
-                instructions = font.render("ARROWS: NAVIGATE  ENTER: SELECT", True, WHITE)
+                instructions = self.messages["ARROWS: NAVIGATE  ENTER: SELECT"]
                 screen.blit(instructions, (SCREEN_WIDTH//2 - instructions.get_width()//2, 80))  # Higher position
 
             else:
-                screen.fill(SKY_BLUE)
+                screen.blit(self.static_bg, (0, 0), (self.camera_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
 
-                # Draw all sprites with camera offset
-                for sprite in self.all_sprites:
-                    screen.blit(sprite.image, (sprite.rect.x - self.camera_x, sprite.rect.y))
+                # Draw dynamic sprites with camera offset
+                self.all_sprites.draw(screen, self.camera_x)
 
             # Draw UI
             self.draw_ui()
@@ -610,47 +914,69 @@ class Game:
         pygame.quit()
         sys.exit()
 
+    def _refill_flame_pool(self):
+        # Sample FLAME_POOL bursts / particles ahead so spawning only slices arrays
+        self._flame_counts = rng.binomial(FLAME_BURST_FRAMES, FLAME_SPAWN_CHANCE, FLAME_POOL)
+        self._flame_xs = rng.integers(0, SCREEN_WIDTH, FLAME_POOL, endpoint=True)
+        self._flame_ys = np.full(FLAME_POOL, SCREEN_HEIGHT)
+        self._flame_vel_xs = rng.uniform(-1, 1, FLAME_POOL)
+        self._flame_vel_ys = rng.uniform(-3, -1, FLAME_POOL)
+        self._flame_lifetimes = rng.integers(15, 30, FLAME_POOL, endpoint=True)  # Slightly reduced lifetime
+        self._burst_index = 0
+        self._flame_index = 0
+
+    def spawn_flames(self):
+        # One batch for the last FLAME_BURST_FRAMES frames
+        if self._burst_index >= FLAME_POOL or self._flame_index + FLAME_BURST_FRAMES > FLAME_POOL:
+            self._refill_flame_pool()
+        count = min(int(self._flame_counts[self._burst_index]),
+                    MAX_PARTICLES - len(self.flame_particles))
+        self._burst_index += 1
+        if count <= 0:
+            return
+        start = self._flame_index
+        end = start + count
+        self.flame_particles.spawn(self._flame_xs[start:end], self._flame_ys[start:end],
+                                   self._flame_vel_xs[start:end], self._flame_vel_ys[start:end],
+                                   self._flame_lifetimes[start:end])
+        self._flame_index = end
+
     def draw_ui(self):
         # Draw score
-        score_text = font.render(f"SCORE: {self.score}", True, WHITE)
+        score_text = render_value(SCORE_FMT, self.score)
         screen.blit(score_text, (15, 15))  # Adjusted position
 
         # Draw lives
-        lives_text = font.render(f"LIVES: {self.lives}", True, WHITE)
+        lives_text = render_value(LIVES_FMT, self.lives)
         screen.blit(lives_text, (15, 35))  # Adjusted position
 
         # Draw level
         if self.game_state == STATE_OVERWORLD:
-            level_text = font.render(f"LEVEL: {self.current_node}", True, WHITE)
+            level_text = render_value(LEVEL_FMT, self.current_node)
         else:
-            level_text = font.render(f"WORLD 1-{self.level}", True, WHITE)
+            level_text = render_value(WORLD_FMT, self.level)
         screen.blit(level_text, (SCREEN_WIDTH - 120, 15))  # Adjusted position
 
         # Draw coins
         if self.game_state == STATE_OVERWORLD:
-            coins_text = font.render(f"COINS: {self.overworld_player.coins_collected}", True, WHITE)
+            coins_text = render_value(COINS_FMT, self.overworld_player.coins_collected)
         else:
-            coins_text = font.render(f"COINS: {self.player.coins_collected}", True, WHITE)
+            coins_text = render_value(COINS_FMT, self.player.coins_collected)
         screen.blit(coins_text, (SCREEN_WIDTH - 120, 35))  # Adjusted position
 
     def draw_message(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._msg_overlay, (0, 0))
 
         if self.game_state == STATE_GAME_OVER:
             if self.lives > 0:
-                text = font.render("GAME OVER", True, WHITE)
-                restart = font.render("PRESS ENTER", True, WHITE)
+                text = self.messages["GAME OVER"]
             else:
-                text = font.render("OUT OF LIVES", True, WHITE)
-                restart = font.render("PRESS ENTER", True, WHITE)
+                text = self.messages["OUT OF LIVES"]
         elif self.game_state == STATE_LEVEL_COMPLETE:
-            text = font.render("LEVEL COMPLETE!", True, WHITE)
-            restart = font.render("PRESS ENTER", True, WHITE)
+            text = self.messages["LEVEL COMPLETE!"]
         elif self.game_state == STATE_WIN:
-            text = font.render("YOU WIN!", True, WHITE)
-            restart = font.render("PRESS ENTER", True, WHITE)
+            text = self.messages["YOU WIN!"]
+        restart = self.messages["PRESS ENTER"]
 
         screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))  # Adjusted Y
         screen.blit(restart, (SCREEN_WIDTH // 2 - restart.get_width() // 2, SCREEN_HEIGHT // 2 + 10))  # Adjusted Y
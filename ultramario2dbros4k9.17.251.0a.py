@@ -1,8 +1,21 @@
 import pygame
 import sys
 import random
+import warnings
 from enum import IntEnum
 from functools import lru_cache
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    warnings.warn("numba not installed; player collisions run as plain Python (slower)")
+
+    def njit(*args, **kwargs):
+        # Stand-in for numba.njit: hand back the function unchanged
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # Initialize Pygame
 pygame.init()
@@ -12,6 +25,10 @@ SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 400
 TILE_SIZE = 24
 FPS = 60
+MAX_PARTICLES = 64  # Capacity of the flame particle arrays
+RAND_POOL = 4096  # Uniform floats drawn per refill of the game's random pool
+SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+HUD_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 60)  # Band covering all four HUD lines
 
 # NES Color Palette (converted to tuples once)
 class Colors:
@@ -34,12 +51,18 @@ class Colors:
     MARIO_BROWN = (136, 64, 0)
     MARIO_SKIN = (255, 180, 180)
 
+# Bare module names for the colors used outside surface setup
+SKY_BLUE = Colors.SKY_BLUE
+WHITE = Colors.WHITE
+
 # Game physics
 GRAVITY = 0.6
 PLAYER_SPEED = 4
 JUMP_POWER = -14
 ENEMY_SPEED = 1.5
+ENEMY_EDGE_OFFSET = 3  # How far below an enemy's leading foot to look for ground
 MAX_VEL_Y = 10
+COLLISION_INSET = 4  # Player collision box sits this far inside the sprite rect
 
 # Game states using IntEnum for faster comparisons
 class GameState(IntEnum):
@@ -53,6 +76,8 @@ class GameState(IntEnum):
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("ULTRA MARIO 2D BROS")
 clock = pygame.time.Clock()
+SKY_BLUE_PIXEL = screen.map_rgb(SKY_BLUE)  # Pre-mapped so fill skips color parsing
+rng = np.random.default_rng()
 
 # Font loading with fallback
 try:
@@ -62,6 +87,11 @@ except:
     font = pygame.font.SysFont("Arial", 12, bold=True)
     title_font = pygame.font.SysFont("Arial", 28, bold=True)
 
+@lru_cache(maxsize=128)
+def render_text(text, color=WHITE):
+    """Render HUD text once per distinct string; repeats hit the cache"""
+    return font.render(text, True, color).convert_alpha()
+
 # Surface Cache - Create surfaces once and reuse
 class SurfaceCache:
     def __init__(self):
@@ -195,11 +225,83 @@ class SurfaceCache:
 # Initialize surface cache
 surface_cache = SurfaceCache()
 
+# Bind the hot surfaces once so sprite constructors skip the dict lookup
+(SURF_GROUND, SURF_BLOCK, SURF_PATH, SURF_GRASS, SURF_PIPE, SURF_QUESTION,
+ SURF_COIN, SURF_MARIO, SURF_FLAG, SURF_GOOMBA, SURF_KOOPA, SURF_FLAME) = (
+    surface_cache.surfaces[name] for name in (
+        'ground', 'block', 'path', 'grass', 'pipe', 'question_block',
+        'coin', 'mario', 'flag', 'goomba', 'koopa', 'flame'))
+ENEMY_SURFS = {'goomba': SURF_GOOMBA, 'koopa': SURF_KOOPA}
+
+# Batched blitting: pygame-ce's fblits skips building a result list,
+# stock pygame gets the same from blits(..., doreturn=False)
+if hasattr(pygame.Surface, "fblits"):
+    def blit_batch(surface, sequence):
+        surface.fblits(sequence)
+else:
+    def blit_batch(surface, sequence):
+        surface.blits(sequence, False)
+
+@njit(cache=True)
+def resolve_collisions(px, py, pw, ph, vx, vy, tiles):
+    """Resolve the player's collision box against tiles, an (N, 4) array of
+    x, y, w, h rows. (px, py) is the sprite rect after the horizontal move;
+    the box is (pw, ph) inset by COLLISION_INSET. Each axis checks every
+    overlapping tile and stops at the nearest edge along the motion, so
+    straddling a seam cannot leave the box inside the second tile. Applies
+    vy in between the two axis checks and returns (px, py, vy, on_ground)."""
+    n = tiles.shape[0]
+
+    # Horizontal: leading edge of the nearest overlapped tile
+    bx = px + COLLISION_INSET
+    by = py + COLLISION_INSET
+    hit = False
+    edge = 0
+    for i in range(n):
+        tx, ty, tw, th = tiles[i, 0], tiles[i, 1], tiles[i, 2], tiles[i, 3]
+        if bx < tx + tw and bx + pw > tx and by < ty + th and by + ph > ty:
+            if vx > 0:
+                edge = tx if not hit else min(edge, tx)
+            elif vx < 0:
+                edge = tx + tw if not hit else max(edge, tx + tw)
+            hit = True
+    if hit:
+        if vx > 0:
+            px = edge - pw - COLLISION_INSET
+        elif vx < 0:
+            px = edge - COLLISION_INSET
+
+    # Vertical move, rounded half away from zero like a pygame Rect
+    y = py + vy
+    py = int(np.floor(y + 0.5)) if y >= 0 else -int(np.floor(0.5 - y))
+    on_ground = False
+    bx = px + COLLISION_INSET
+    by = py + COLLISION_INSET
+    hit = False
+    edge = 0
+    for i in range(n):
+        tx, ty, tw, th = tiles[i, 0], tiles[i, 1], tiles[i, 2], tiles[i, 3]
+        if bx < tx + tw and bx + pw > tx and by < ty + th and by + ph > ty:
+            if vy > 0:
+                edge = ty if not hit else min(edge, ty)
+            elif vy < 0:
+                edge = ty + th if not hit else max(edge, ty + th)
+            hit = True
+    if hit:
+        if vy > 0:
+            py = edge - ph - COLLISION_INSET
+            vy = 0.0
+            on_ground = True
+        elif vy < 0:
+            py = edge - COLLISION_INSET
+            vy = 0.0
+    return px, py, vy, on_ground
+
 # Optimized sprite classes with better collision detection
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = surface_cache.get('mario')
+        self.image = SURF_MARIO
         self.rect = self.image.get_rect(topleft=(x, y))
         self.vel_x = 0
         self.vel_y = 0
@@ -209,22 +311,20 @@ class Player(pygame.sprite.Sprite):
         self.enemies_defeated = 0
         
         # Collision optimization - smaller rect for more accurate collisions
-        self.collision_rect = pygame.Rect(x+4, y+4, TILE_SIZE-8, TILE_SIZE*2-8)
+        self.collision_rect = pygame.Rect(x + COLLISION_INSET, y + COLLISION_INSET,
+                                          TILE_SIZE - 2*COLLISION_INSET, TILE_SIZE*2 - 2*COLLISION_INSET)
 
-    def update(self, tiles, enemies, coins, flag):
+    def update(self, tile_rects, enemies, coins_near, flag):
         # Apply gravity with terminal velocity
         self.vel_y = min(self.vel_y + GRAVITY, MAX_VEL_Y)
 
-        # Move horizontally
-        self.rect.x += self.vel_x
-        self.collision_rect.x = self.rect.x + 4
-        self._check_horizontal_collisions(tiles)
-
-        # Move vertically
-        self.rect.y += self.vel_y
-        self.collision_rect.y = self.rect.y + 4
-        self.on_ground = False
-        self._check_vertical_collisions(tiles)
+        # Move horizontally then vertically, resolving tile hits in the kernel
+        x, y, self.vel_y, self.on_ground = resolve_collisions(
+            self.rect.x + self.vel_x, self.rect.y,
+            self.collision_rect.w, self.collision_rect.h,
+            self.vel_x, self.vel_y, tile_rects)
+        self.rect.topleft = (x, y)
+        self.collision_rect.topleft = (x + COLLISION_INSET, y + COLLISION_INSET)
 
         # Check enemy collisions (optimized with early exit)
         for enemy in enemies:
@@ -237,9 +337,12 @@ class Player(pygame.sprite.Sprite):
                 else:
                     return (GameState.GAME_OVER, 0, 0)
 
-        # Check coin collisions
-        coins_hit = pygame.sprite.spritecollide(self, coins, True)
+        # Check coin collisions against the nearby grid cells only
+        nearby = coins_near(self.rect)
+        coins_hit = self.rect.collidelistall(nearby)
         if coins_hit:
+            for i in coins_hit:
+                nearby[i].kill()
             self.coins_collected += len(coins_hit)
             return (GameState.PLAYING, len(coins_hit) * 100, 0)
 
@@ -253,80 +356,93 @@ class Player(pygame.sprite.Sprite):
 
         return (GameState.PLAYING, 0, 0)
 
-    def _check_horizontal_collisions(self, tiles):
-        for tile in tiles:
-            if self.collision_rect.colliderect(tile.rect):
-                if self.vel_x > 0:
-                    self.rect.right = tile.rect.left + 4
-                    self.collision_rect.right = tile.rect.left
-                elif self.vel_x < 0:
-                    self.rect.left = tile.rect.right - 4
-                    self.collision_rect.left = tile.rect.right
-                break  # Early exit after first collision
-
-    def _check_vertical_collisions(self, tiles):
-        for tile in tiles:
-            if self.collision_rect.colliderect(tile.rect):
-                if self.vel_y > 0:
-                    self.rect.bottom = tile.rect.top + 4
-                    self.collision_rect.bottom = tile.rect.top
-                    self.vel_y = 0
-                    self.on_ground = True
-                elif self.vel_y < 0:
-                    self.rect.top = tile.rect.bottom - 4
-                    self.collision_rect.top = tile.rect.bottom
-                    self.vel_y = 0
-                break  # Early exit
-
-class Tile(pygame.sprite.Sprite):
-    __slots__ = ['image', 'rect']  # Memory optimization
+class Tile:
+    # Static scenery: a plain slotted record, no Sprite/Group bookkeeping
+    __slots__ = ['image', 'rect']
     
     def __init__(self, x, y, surface):
-        super().__init__()
         self.image = surface
         self.rect = self.image.get_rect(topleft=(x, y))
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, enemy_type="goomba"):
         super().__init__()
-        self.image = surface_cache.get(enemy_type)
+        self.image = ENEMY_SURFS[enemy_type]
         self.rect = self.image.get_rect(topleft=(x, y))
         self.direction = -1
         self.speed = ENEMY_SPEED
         self.enemy_type = enemy_type
-        
-        # Pre-calculate edge check offsets
-        self.edge_offset = 3
-
-    def update(self, tiles):
-        # Move
-        self.rect.x += self.direction * self.speed
-
-        # Optimized collision and edge detection
-        for tile in tiles:
-            if self.rect.colliderect(tile.rect):
-                self.direction *= -1
-                return
-
-        # Edge detection with cached offset
-        check_x = self.rect.left if self.direction < 0 else self.rect.right
-        check_rect = pygame.Rect(check_x, self.rect.bottom + self.edge_offset, 1, 1)
-
-        if not any(check_rect.colliderect(tile.rect) for tile in tiles):
-            self.direction *= -1
+        self.index = -1  # Slot in the owning EnemySystem's arrays
+
+class EnemySystem(pygame.sprite.Group):
+    """Enemy sprites whose positions, directions and speeds are mirrored in
+    NumPy arrays, so the whole cohort moves and collides in one vectorized step"""
+    def freeze(self):
+        # Call once every enemy of the level has been added
+        self.members = self.sprites()
+        for index, enemy in enumerate(self.members):
+            enemy.index = index
+        rects = [enemy.rect for enemy in self.members]
+        self.x = np.array([r.x for r in rects], dtype=np.int32)
+        self.y = np.array([r.y for r in rects], dtype=np.int32)
+        self.w = np.array([r.width for r in rects], dtype=np.int32)
+        self.h = np.array([r.height for r in rects], dtype=np.int32)
+        self.direction = np.array([enemy.direction for enemy in self.members], dtype=np.int32)
+        self.speed = np.array([enemy.speed for enemy in self.members], dtype=np.float64)
+        self.alive = np.ones(len(rects), dtype=np.bool_)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if sprite.index >= 0:
+            self.alive[sprite.index] = False
+
+    def update(self, tile_rects):
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return
+        direction = self.direction[live]
+        y = self.y[live]
+        w = self.w[live]
+        h = self.h[live]
+
+        # Move, rounding half away from zero like a pygame Rect
+        x = self.x[live] + direction * self.speed[live]
+        x = np.where(x >= 0, np.floor(x + 0.5), -np.floor(0.5 - x)).astype(np.int32)
+
+        # Every enemy against every tile at once: (enemies, tiles) boolean grids
+        tx, ty, tw, th = tile_rects.T
+        hit = ((x[:, None] < tx + tw) & ((x + w)[:, None] > tx)
+               & (y[:, None] < ty + th) & ((y + h)[:, None] > ty)).any(axis=1)
+
+        # Ledge check: is there a tile under the point past the leading foot?
+        probe_x = np.where(direction < 0, x, x + w)[:, None]
+        probe_y = (y + h + ENEMY_EDGE_OFFSET)[:, None]
+        supported = ((tx <= probe_x) & (probe_x < tx + tw)
+                     & (ty <= probe_y) & (probe_y < ty + th)).any(axis=1)
+
+        # Walls turn an enemy around; so does a ledge when it did not just hit a wall
+        direction = np.where(hit | ~supported, -direction, direction)
+        self.x[live] = x
+        self.direction[live] = direction
+
+        members = self.members
+        for index, new_x, new_dir in zip(live.tolist(), x.tolist(), direction.tolist()):
+            enemy = members[index]
+            enemy.rect.x = new_x
+            enemy.direction = new_dir
 
 class Coin(pygame.sprite.Sprite):
     __slots__ = ['image', 'rect']
     
     def __init__(self, x, y):
         super().__init__()
-        self.image = surface_cache.get('coin')
+        self.image = SURF_COIN
         self.rect = self.image.get_rect(topleft=(x, y))
 
 class Flag(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = surface_cache.get('flag')
+        self.image = SURF_FLAG
         self.rect = self.image.get_rect(bottomleft=(x, y))
 
 class LevelNode(pygame.sprite.Sprite):
@@ -336,28 +452,79 @@ class LevelNode(pygame.sprite.Sprite):
         pygame.draw.rect(self.image, Colors.PURPLE, (0, 0, TILE_SIZE*2, TILE_SIZE*2), border_radius=6)
         pygame.draw.rect(self.image, (180, 100, 220), (3, 3, TILE_SIZE*2-6, TILE_SIZE*2-6), border_radius=5)
         
-        level_text = font.render(str(level_num), True, Colors.WHITE)
+        level_text = font.render(str(level_num), True, WHITE)
         text_rect = level_text.get_rect(center=(TILE_SIZE, TILE_SIZE))
         self.image.blit(level_text, text_rect)
         
         self.rect = self.image.get_rect(center=(x, y))
         self.level_num = level_num
 
-class FlameParticle(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = surface_cache.get('flame')
-        self.rect = self.image.get_rect(center=(x, y))
-        self.vel_x = random.uniform(-1, 1)
-        self.vel_y = random.uniform(-3, -1)
-        self.lifetime = random.randint(15, 30)
+class ParticleArray:
+    """Flame particles stored as parallel NumPy arrays (top-left x/y, velocity, frames left)"""
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.vx = np.empty(capacity, dtype=np.float32)
+        self.vy = np.empty(capacity, dtype=np.float32)
+        self.life = np.empty(capacity, dtype=np.int16)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def spawn(self, x, y, vel_x, vel_y, lifetime):
+        n = self.n
+        if n == len(self.life):
+            return
+        # SURF_FLAME is 3x3, so the top-left sits one pixel up/left of the centre
+        self.x[n] = x - 1
+        self.y[n] = y - 1
+        self.vx[n] = vel_x
+        self.vy[n] = vel_y
+        self.life[n] = lifetime
+        self.n = n + 1
 
     def update(self):
-        self.rect.x += self.vel_x
-        self.rect.y += self.vel_y
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
+        n = self.n
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+
+        # Compact the survivors to the front of the arrays
+        alive = self.life[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life):
+                arr[:survivors] = arr[:n][alive]
+            self.n = survivors
+
+    def draw(self, surface):
+        """Blit every live particle and return the rects touched"""
+        n = self.n
+        coords = list(zip(self.x[:n].astype(np.int32).tolist(), self.y[:n].astype(np.int32).tolist()))
+        blit_batch(surface, [(SURF_FLAME, pos) for pos in coords])
+        size = SURF_FLAME.get_size()
+        return [pygame.Rect(pos, size) for pos in coords]
+
+class SnapshotGroup(pygame.sprite.Group):
+    """Group that hands out one cached sprite list until its membership changes"""
+    def __init__(self, *sprites):
+        self._snapshot = None
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._snapshot = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._snapshot = None
+
+    def sprites(self):
+        # Shared list: callers must treat it as read-only
+        if self._snapshot is None:
+            self._snapshot = list(self.spritedict)
+        return self._snapshot
 
 # Optimized Game class
 class Game:
@@ -368,7 +535,28 @@ class Game:
         self.max_level = 8
         self.game_state = GameState.OVERWORLD
         self.initial_coin_count = 0
-        self.flame_particles = pygame.sprite.Group()
+        self.flame_particles = ParticleArray()
+        self._refill_rand()
+
+        # Dirty-rect bookkeeping: what was drawn last frame and from which view
+        self._prev_dirty = []
+        self._last_view = None
+
+        # Input dispatch: (game state, event type, key) -> handler
+        KEYDOWN, KEYUP = pygame.KEYDOWN, pygame.KEYUP
+        self._input_table = {
+            (GameState.OVERWORLD, KEYDOWN, pygame.K_RIGHT): self._next_node,
+            (GameState.OVERWORLD, KEYDOWN, pygame.K_LEFT): self._previous_node,
+            (GameState.OVERWORLD, KEYDOWN, pygame.K_RETURN): self._enter_level,
+            (GameState.PLAYING, KEYDOWN, pygame.K_LEFT): self._run_left,
+            (GameState.PLAYING, KEYDOWN, pygame.K_RIGHT): self._run_right,
+            (GameState.PLAYING, KEYDOWN, pygame.K_SPACE): self._jump,
+            (GameState.PLAYING, KEYDOWN, pygame.K_ESCAPE): self._exit_to_overworld,
+            (GameState.PLAYING, KEYUP, pygame.K_LEFT): self._stop_running,
+            (GameState.PLAYING, KEYUP, pygame.K_RIGHT): self._stop_running,
+        }
+        for state in (GameState.GAME_OVER, GameState.LEVEL_COMPLETE, GameState.WIN):
+            self._input_table[state, KEYDOWN, pygame.K_RETURN] = self._handle_game_state_transition
         
         # Pre-create text surfaces that don't change often
         self._create_static_texts()
@@ -377,21 +565,21 @@ class Game:
     def _create_static_texts(self):
         """Pre-render static text for better performance"""
         self.title_text = title_font.render("ULTRA MARIO 2D BROS", True, Colors.RED)
-        self.instructions_text = font.render("ARROWS: NAVIGATE  ENTER: SELECT", True, Colors.WHITE)
+        self.instructions_text = font.render("ARROWS: NAVIGATE  ENTER: SELECT", True, WHITE)
         
         # Game state messages
-        self.game_over_text = font.render("GAME OVER", True, Colors.WHITE)
-        self.out_of_lives_text = font.render("OUT OF LIVES", True, Colors.WHITE)
-        self.level_complete_text = font.render("LEVEL COMPLETE!", True, Colors.WHITE)
-        self.you_win_text = font.render("YOU WIN!", True, Colors.WHITE)
-        self.press_enter_text = font.render("PRESS ENTER", True, Colors.WHITE)
+        self.game_over_text = font.render("GAME OVER", True, WHITE)
+        self.out_of_lives_text = font.render("OUT OF LIVES", True, WHITE)
+        self.level_complete_text = font.render("LEVEL COMPLETE!", True, WHITE)
+        self.you_win_text = font.render("YOU WIN!", True, WHITE)
+        self.press_enter_text = font.render("PRESS ENTER", True, WHITE)
         
         # Create overlay surface once
         self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         self.overlay.fill((0, 0, 0, 150))
 
     def create_overworld(self):
-        self.overworld_sprites = pygame.sprite.Group()
+        self.overworld_sprites = []
         self.level_nodes = pygame.sprite.Group()
 
         # Pre-calculated positions
@@ -400,8 +588,7 @@ class Game:
                           if (x // TILE_SIZE) % 2 == 0 and (y // TILE_SIZE) % 2 == 0]
         
         for x, y in grass_positions:
-            tile = Tile(x, y, surface_cache.get('grass'))
-            self.overworld_sprites.add(tile)
+            self.overworld_sprites.append(Tile(x, y, SURF_GRASS))
 
         # Create path
         path_points = [
@@ -417,10 +604,10 @@ class Game:
 
             if start_x == end_x:  # Vertical
                 for y in range(start_y, end_y, TILE_SIZE if start_y < end_y else -TILE_SIZE):
-                    self.overworld_sprites.add(Tile(start_x, y, surface_cache.get('path')))
+                    self.overworld_sprites.append(Tile(start_x, y, SURF_PATH))
             else:  # Horizontal
                 for x in range(start_x, end_x, TILE_SIZE if start_x < end_x else -TILE_SIZE):
-                    self.overworld_sprites.add(Tile(x, start_y, surface_cache.get('path')))
+                    self.overworld_sprites.append(Tile(x, start_y, SURF_PATH))
 
         # Create level nodes
         level_positions = [
@@ -431,65 +618,91 @@ class Game:
         for i, pos in enumerate(level_positions):
             node = LevelNode(pos[0], pos[1], i+1)
             self.level_nodes.add(node)
-            self.overworld_sprites.add(node)
+            self.overworld_sprites.append(node)
+
+        # Grass, path, nodes and title never change: composite them once
+        self.overworld_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.overworld_bg.fill(SKY_BLUE_PIXEL)
+        self.overworld_bg.blit(self.title_text, (SCREEN_WIDTH//2 - self.title_text.get_width()//2, 15))
+        blit_batch(self.overworld_bg, [(s.image, s.rect) for s in self.overworld_sprites])
 
         # Create player
         self.overworld_player = Player(80, 350 - TILE_SIZE*2)
-        self.overworld_sprites.add(self.overworld_player)
         
         self.level_nodes_list = list(self.level_nodes)  # Cache for faster access
         self.current_node = 1
 
     def reset_level(self):
-        self.all_sprites = pygame.sprite.Group()
-        self.tiles = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.all_sprites = SnapshotGroup()
+        self.tiles = []
+        self.enemies = EnemySystem()
         self.coins = pygame.sprite.Group()
 
         # Calculate level width
         self.level_width = SCREEN_WIDTH * (1 + self.level // 2)
 
-        # Generate level with optimized loops
-        ground_tiles = []
-        for x in range(0, self.level_width, TILE_SIZE):
-            ground_tiles.append(Tile(x, SCREEN_HEIGHT - TILE_SIZE, surface_cache.get('ground')))
-            
-            # Platform generation with reduced random calls
-            if x > SCREEN_WIDTH//2 and x < self.level_width - SCREEN_WIDTH//2:
-                rand_val = random.random()
-                if rand_val < 0.2:
-                    height = random.randint(3, 5)
-                    y_start = SCREEN_HEIGHT - TILE_SIZE * height
-                    
-                    for y in range(y_start, SCREEN_HEIGHT - TILE_SIZE, TILE_SIZE):
-                        ground_tiles.append(Tile(x, y, surface_cache.get('block')))
-                    
-                    # Add coins and enemies
-                    if random.random() < 0.7:
-                        self.coins.add(Coin(x + TILE_SIZE//4, y_start - TILE_SIZE//2))
-                    
-                    if random.random() < 0.4:
-                        enemy_type = "koopa" if self.level > 3 else "goomba"
-                        self.enemies.add(Enemy(x, y_start - TILE_SIZE, enemy_type))
-        
-        self.tiles.add(ground_tiles)
+        # Generate level in one pass; every column's rolls come from one NumPy draw
+        # (platform chance, height, coin chance, enemy chance)
+        tiles = self.tiles
+        enemy_type = "koopa" if self.level > 3 else "goomba"
+        columns = range(0, self.level_width, TILE_SIZE)
+
+        # The ground is one level-wide Tile: a single surface and a single collision rect.
+        # It goes first so it still wins ties the way the leftmost ground column did
+        ground_strip = pygame.Surface((self.level_width, TILE_SIZE)).convert()
+        blit_batch(ground_strip, [(SURF_GROUND, (x, 0)) for x in columns])
+        tiles.append(Tile(0, SCREEN_HEIGHT - TILE_SIZE, ground_strip))
+
+        column_rolls = rng.random((len(columns), 4), dtype=np.float32).tolist()
+        for x, (platform_roll, height_roll, coin_roll, enemy_roll) in zip(columns, column_rolls):
+            # Platform generation
+            if SCREEN_WIDTH//2 < x < self.level_width - SCREEN_WIDTH//2 and platform_roll < 0.2:
+                height = 3 + int(height_roll * 3)
+                y_start = SCREEN_HEIGHT - TILE_SIZE * height
+                
+                for y in range(y_start, SCREEN_HEIGHT - TILE_SIZE, TILE_SIZE):
+                    tiles.append(Tile(x, y, SURF_BLOCK))
+                
+                # Add coins and enemies
+                if coin_roll < 0.7:
+                    self.coins.add(Coin(x + TILE_SIZE//4, y_start - TILE_SIZE//2))
+                
+                if enemy_roll < 0.4:
+                    self.enemies.add(Enemy(x, y_start - TILE_SIZE, enemy_type))
 
         # Add pipes
         pipe_x = SCREEN_WIDTH + 100
-        self.tiles.add(Tile(pipe_x, SCREEN_HEIGHT - TILE_SIZE*2, surface_cache.get('pipe')))
-
-        # Add question blocks
-        for x in range(SCREEN_WIDTH//2, self.level_width - SCREEN_WIDTH//2, 150):
-            if random.random() < 0.6:
-                y = SCREEN_HEIGHT - TILE_SIZE * random.randint(3, 4)
-                self.tiles.add(Tile(x, y, surface_cache.get('question_block')))
+        tiles.append(Tile(pipe_x, SCREEN_HEIGHT - TILE_SIZE*2, SURF_PIPE))
+
+        # Add question blocks (block chance, height, coin chance)
+        block_xs = range(SCREEN_WIDTH//2, self.level_width - SCREEN_WIDTH//2, 150)
+        block_rolls = rng.random((len(block_xs), 3), dtype=np.float32).tolist()
+        for x, (block_roll, height_roll, coin_roll) in zip(block_xs, block_rolls):
+            if block_roll < 0.6:
+                y = SCREEN_HEIGHT - TILE_SIZE * (3 + int(height_roll * 2))
+                tiles.append(Tile(x, y, SURF_QUESTION))
                 
-                if random.random() < 0.5:
+                if coin_roll < 0.5:
                     self.coins.add(Coin(x + TILE_SIZE//4, y - TILE_SIZE))
 
+        self.enemies.freeze()
+
+        # Tile rects as an (N, 4) int32 array for the player and enemy collision passes
+        self.tile_rects = np.array([tuple(t.rect) for t in tiles], dtype=np.int32).reshape(-1, 4)
+
+        # Coins never move: bucket them by grid cell for broadphase queries
+        self.coin_grid = {}
+        for coin in self.coins:
+            for cell in self._grid_cells(coin.rect):
+                self.coin_grid.setdefault(cell, []).append(coin)
+
         # Add flag
         self.flag = Flag(self.level_width - 80, SCREEN_HEIGHT - TILE_SIZE)
-        self.all_sprites.add(self.tiles, self.enemies, self.coins, self.flag)
+        # Tiles are static, so they live in level_bg rather than all_sprites
+        self.level_bg = pygame.Surface((self.level_width, SCREEN_HEIGHT)).convert()
+        self.level_bg.fill(SKY_BLUE_PIXEL)
+        blit_batch(self.level_bg, [(t.image, t.rect) for t in tiles])
+        self.all_sprites.add(self.enemies, self.coins, self.flag)
 
         # Create player
         self.player = Player(50, SCREEN_HEIGHT - TILE_SIZE * 3)
@@ -497,41 +710,63 @@ class Game:
 
         self.camera_x = 0
         self.initial_coin_count = len(self.coins)
+        self._last_view = None
+
+    @staticmethod
+    def _grid_cells(rect):
+        """Grid cells (gx, gy) overlapped by rect"""
+        for gx in range(rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE + 1):
+            for gy in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1):
+                yield gx, gy
+
+    def coins_near(self, rect):
+        """Uncollected coins sharing a grid cell with rect"""
+        grid = self.coin_grid
+        found = {}
+        for cell in self._grid_cells(rect):
+            for coin in grid.get(cell, ()):
+                if coin.alive():
+                    found[coin] = None
+        return list(found)
 
     def handle_input(self, event):
-        """Centralized input handling for cleaner code"""
-        if event.type == pygame.KEYDOWN:
-            if self.game_state == GameState.OVERWORLD:
-                if event.key == pygame.K_RIGHT and self.current_node < len(self.level_nodes):
-                    self.current_node += 1
-                    self._move_overworld_player()
-                elif event.key == pygame.K_LEFT and self.current_node > 1:
-                    self.current_node -= 1
-                    self._move_overworld_player()
-                elif event.key == pygame.K_RETURN:
-                    self.level = self.current_node
-                    self.reset_level()
-                    self.game_state = GameState.PLAYING
-
-            elif self.game_state == GameState.PLAYING:
-                if event.key == pygame.K_LEFT:
-                    self.player.vel_x = -PLAYER_SPEED
-                    self.player.direction = -1
-                elif event.key == pygame.K_RIGHT:
-                    self.player.vel_x = PLAYER_SPEED
-                    self.player.direction = 1
-                elif event.key == pygame.K_SPACE and self.player.on_ground:
-                    self.player.vel_y = JUMP_POWER
-                elif event.key == pygame.K_ESCAPE:
-                    self.game_state = GameState.OVERWORLD
-
-            elif self.game_state in [GameState.GAME_OVER, GameState.LEVEL_COMPLETE, GameState.WIN]:
-                if event.key == pygame.K_RETURN:
-                    self._handle_game_state_transition()
-
-        elif event.type == pygame.KEYUP:
-            if event.key in [pygame.K_LEFT, pygame.K_RIGHT] and self.game_state == GameState.PLAYING:
-                self.player.vel_x = 0
+        """Centralized input handling: one table lookup per event"""
+        handler = self._input_table.get((self.game_state, event.type, getattr(event, 'key', None)))
+        if handler is not None:
+            handler()
+
+    def _next_node(self):
+        if self.current_node < len(self.level_nodes):
+            self.current_node += 1
+            self._move_overworld_player()
+
+    def _previous_node(self):
+        if self.current_node > 1:
+            self.current_node -= 1
+            self._move_overworld_player()
+
+    def _enter_level(self):
+        self.level = self.current_node
+        self.reset_level()
+        self.game_state = GameState.PLAYING
+
+    def _run_left(self):
+        self.player.vel_x = -PLAYER_SPEED
+        self.player.direction = -1
+
+    def _run_right(self):
+        self.player.vel_x = PLAYER_SPEED
+        self.player.direction = 1
+
+    def _jump(self):
+        if self.player.on_ground:
+            self.player.vel_y = JUMP_POWER
+
+    def _exit_to_overworld(self):
+        self.game_state = GameState.OVERWORLD
+
+    def _stop_running(self):
+        self.player.vel_x = 0
 
     def _move_overworld_player(self):
         """Move player to current node position"""
@@ -563,7 +798,7 @@ class Game:
         """Update game logic"""
         if self.game_state == GameState.PLAYING:
             # Update player
-            result = self.player.update(self.tiles, self.enemies, self.coins, self.flag)
+            result = self.player.update(self.tile_rects, self.enemies, self.coins_near, self.flag)
             game_state, coin_points, enemy_points = result
             
             self.score += coin_points + enemy_points
@@ -572,7 +807,7 @@ class Game:
                 self.game_state = game_state
             
             # Update enemies
-            self.enemies.update(self.tiles)
+            self.enemies.update(self.tile_rects)
             
             # Update camera
             self.camera_x = max(0, min(
@@ -581,53 +816,88 @@ class Game:
             ))
 
         # Update flame particles
-        if random.random() < 0.3:
-            self.flame_particles.add(FlameParticle(
-                random.randint(0, SCREEN_WIDTH),
-                SCREEN_HEIGHT
-            ))
+        if self._take(1)[0] < 0.3:
+            r = self._take(4)
+            self.flame_particles.spawn(
+                int(r[0] * (SCREEN_WIDTH + 1)),
+                SCREEN_HEIGHT,
+                r[1] * 2 - 1,        # vel_x in [-1, 1)
+                r[2] * 2 - 3,        # vel_y in [-3, -1)
+                15 + int(r[3] * 16)  # lifetime in [15, 30]
+            )
         self.flame_particles.update()
 
+    def _refill_rand(self):
+        """Draw a fresh block of uniform [0, 1) floats for per-frame effects"""
+        self._rand = rng.random(RAND_POOL, dtype=np.float32)
+        self._ri = 0
+
+    def _take(self, count):
+        """Next count values from the random pool, refilling when it runs dry"""
+        if self._ri + count > RAND_POOL:
+            self._refill_rand()
+        start = self._ri
+        self._ri = start + count
+        return self._rand[start:start + count]
+
     def draw(self):
-        """Optimized drawing with reduced function calls"""
+        """Draw the frame and return the screen rects that need updating"""
         if self.game_state == GameState.OVERWORLD:
-            screen.fill(Colors.SKY_BLUE)
-            screen.blit(self.title_text, (SCREEN_WIDTH//2 - self.title_text.get_width()//2, 15))
-            self.overworld_sprites.draw(screen)
-            self.flame_particles.draw(screen)
+            view = (self.game_state, 0)
+            screen.blit(self.overworld_bg, (0, 0))
+            screen.blit(self.overworld_player.image, self.overworld_player.rect)
+            dirty = self.flame_particles.draw(screen)
+            dirty.append(self.overworld_player.rect.copy())
             screen.blit(self.instructions_text, 
                        (SCREEN_WIDTH//2 - self.instructions_text.get_width()//2, 80))
         else:
-            screen.fill(Colors.SKY_BLUE)
-            
-            # Draw sprites with camera offset (batch where possible)
-            for sprite in self.all_sprites:
-                screen.blit(sprite.image, (sprite.rect.x - self.camera_x, sprite.rect.y))
+            view = (self.game_state, self.camera_x)
+            # Visible slice of the pre-composited tiles
+            screen.blit(self.level_bg, (0, 0), (self.camera_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+            # Cull to the camera view in C, then draw with camera offset in one batched call
+            camera_x = self.camera_x
+            sprites = self.all_sprites.sprites()
+            visible = [sprites[i] for i in SCREEN_RECT.move(camera_x, 0).collidelistall(sprites)]
+            blit_batch(screen, [(s.image, (s.rect.x - camera_x, s.rect.y)) for s in visible])
+            dirty = [s.rect.move(-camera_x, 0) for s in visible]
 
         self.draw_ui()
+        dirty.append(HUD_RECT)
         
         if self.game_state not in [GameState.PLAYING, GameState.OVERWORLD]:
             self.draw_message()
+            view = None
+
+        # A scrolled camera or new scene changes every pixel; otherwise only
+        # this frame's sprites and the spots they left last frame changed
+        if view is None or view != self._last_view:
+            update_rects = [SCREEN_RECT]
+        else:
+            update_rects = self._prev_dirty + dirty
+        self._prev_dirty = dirty
+        self._last_view = view
+        return update_rects
 
     def draw_ui(self):
         """Draw UI elements with cached text where possible"""
-        # Dynamic text that changes frequently
-        score_text = font.render(f"SCORE: {self.score}", True, Colors.WHITE)
+        # Dynamic text only re-renders when its value changes
+        score_text = render_text(f"SCORE: {self.score}")
         screen.blit(score_text, (15, 15))
         
-        lives_text = font.render(f"LIVES: {self.lives}", True, Colors.WHITE)
+        lives_text = render_text(f"LIVES: {self.lives}")
         screen.blit(lives_text, (15, 35))
         
         if self.game_state == GameState.OVERWORLD:
-            level_text = font.render(f"LEVEL: {self.current_node}", True, Colors.WHITE)
+            level_text = render_text(f"LEVEL: {self.current_node}")
             coins = self.overworld_player.coins_collected
         else:
-            level_text = font.render(f"WORLD 1-{self.level}", True, Colors.WHITE)
+            level_text = render_text(f"WORLD 1-{self.level}")
             coins = self.player.coins_collected
         
         screen.blit(level_text, (SCREEN_WIDTH - 120, 15))
         
-        coins_text = font.render(f"COINS: {coins}", True, Colors.WHITE)
+        coins_text = render_text(f"COINS: {coins}")
         screen.blit(coins_text, (SCREEN_WIDTH - 120, 35))
 
     def draw_message(self):
@@ -654,21 +924,19 @@ class Game:
         running = True
         
         while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                else:
-                    self.handle_input(event)
+            # Handle events; most frames have none, so skip building the list
+            if pygame.event.peek():
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    else:
+                        self.handle_input(event)
             
             # Update
             self.update()
             
-            # Draw
-            self.draw()
-            
-            # Flip display and maintain framerate
-            pygame.display.flip()
+            # Draw, then push only the changed rects to the display
+            pygame.display.update(self.draw())
             clock.tick(FPS)
         
         pygame.quit()